@@ -9,121 +9,180 @@ This example demonstrates the classic assignment problem using:
 Problem: Assign workers to tasks to minimize total cost.
 """
 
+import cvxpy as cp
+import numpy as np
 import pandas as pd
+from scipy.optimize import linear_sum_assignment
 
 from cvxpy_or import (
     Model,
+    Parameter,
     Set,
-    parameter_from_dataframe,
     print_variable,
     sum_by,
-    variable_to_dataframe,
 )
 
-# =============================================================================
-# INPUT DATA (as pandas DataFrame)
-# =============================================================================
-
-# Cost matrix as a DataFrame (more realistic data input)
-cost_df = pd.DataFrame(
-    {
-        "worker": [
-            "Alice",
-            "Alice",
-            "Alice",
-            "Alice",
-            "Bob",
-            "Bob",
-            "Bob",
-            "Bob",
-            "Carol",
-            "Carol",
-            "Carol",
-            "Carol",
-            "David",
-            "David",
-            "David",
-            "David",
-        ],
-        "task": ["Task_A", "Task_B", "Task_C", "Task_D"] * 4,
-        "cost": [
-            9,
-            11,
-            14,
-            8,  # Alice
-            6,
-            4,
-            10,
-            7,  # Bob
-            5,
-            8,
-            12,
-            11,  # Carol
-            7,
-            9,
-            3,
-            10,
-        ],  # David
-    }
-)
-
-print("=== Input Cost Data ===")
-print(cost_df.pivot(index="worker", columns="task", values="cost"))
-print()
-
-# =============================================================================
-# CREATE MODEL
-# =============================================================================
-
-m = Model(name="assignment")
-
-# Define sets from DataFrame columns
-workers = Set(cost_df["worker"].unique().tolist(), name="workers")
-tasks = Set(cost_df["task"].unique().tolist(), name="tasks")
-assignments = Set.cross(workers, tasks, name="assignments")
-
-# Load cost parameter directly from DataFrame
-cost = parameter_from_dataframe(
-    cost_df, index_cols=["worker", "task"], value_col="cost", name="cost"
-)
 
-# Decision variable
-assign = m.add_variable(assignments, nonneg=True, name="assign")
-
-# Constraints
-m.add_constraint("one_task_per_worker", sum_by(assign, "workers") == 1)
-m.add_constraint("one_worker_per_task", sum_by(assign, "tasks") == 1)
-m.add_constraint("upper_bound", assign <= 1)
-
-# Objective
-m.minimize(cost @ assign)
-
-# =============================================================================
-# SOLVE
-# =============================================================================
-
-m.solve()
-
-# =============================================================================
-# RESULTS
-# =============================================================================
-
-print("=== Model Summary ===")
-m.print_summary()
-print()
-
-# Export solution to pandas DataFrame
-print("=== Solution as DataFrame ===")
-solution_df = variable_to_dataframe(assign, value_col="assigned")
-solution_df = solution_df[solution_df["assigned"] > 0.5]  # Filter to assignments
-# Rename column to match original DataFrame for merge
-solution_df = solution_df.rename(columns={"workers": "worker", "tasks": "task"})
-solution_df = solution_df.merge(cost_df, on=["worker", "task"])
-print(solution_df[["worker", "task", "cost"]].to_string(index=False))
-print()
-print(f"Total cost: {solution_df['cost'].sum()}")
-print()
-
-# Fancy table display
-print("=== Assignment Matrix (Rich Table) ===")
-print_variable(assign, show_zero=False, precision=0)
+def main() -> None:
+    """Build, solve, and report the assignment problem."""
+    # =============================================================================
+    # INPUT DATA (as pandas DataFrame)
+    # =============================================================================
+
+    # Cost matrix as a DataFrame (more realistic data input)
+    cost_df = pd.DataFrame(
+        {
+            "worker": [
+                "Alice",
+                "Alice",
+                "Alice",
+                "Alice",
+                "Bob",
+                "Bob",
+                "Bob",
+                "Bob",
+                "Carol",
+                "Carol",
+                "Carol",
+                "Carol",
+                "David",
+                "David",
+                "David",
+                "David",
+            ],
+            "task": ["Task_A", "Task_B", "Task_C", "Task_D"] * 4,
+            "cost": [
+                9,
+                11,
+                14,
+                8,  # Alice
+                6,
+                4,
+                10,
+                7,  # Bob
+                5,
+                8,
+                12,
+                11,  # Carol
+                7,
+                9,
+                3,
+                10,
+            ],  # David
+        }
+    )
+
+    print("=== Input Cost Data ===")
+    print(cost_df.pivot(index="worker", columns="task", values="cost"))
+    print()
+
+    # =============================================================================
+    # CREATE MODEL
+    # =============================================================================
+
+    m = Model(name="assignment", default_solver=cp.HIGHS)
+
+    # Define sets from DataFrame columns
+    workers = Set(cost_df["worker"].unique().tolist(), name="workers")
+    tasks = Set(cost_df["task"].unique().tolist(), name="tasks")
+    assignments = Set.cross(workers, tasks, name="assignments")
+
+    # Load the cost matrix (workers x tasks, in Set order) straight into the parameter
+    cost_matrix = (
+        cost_df.pivot(index="worker", columns="task", values="cost")
+        .reindex(index=workers.to_list(), columns=tasks.to_list())
+        .to_numpy(dtype=np.float64)
+    )
+    cost = Parameter(assignments, data=cost_matrix, name="cost")
+
+    # Decision variable (no upper bound needed: nonneg plus the row/column sums
+    # of 1 already keep every entry in [0, 1])
+    assign = m.add_variable(assignments, nonneg=True, name="assign")
+
+    # Constraints
+    m.add_constraint("one_task_per_worker", sum_by(assign, "workers") == 1)
+    m.add_constraint("one_worker_per_task", sum_by(assign, "tasks") == 1)
+
+    # Objective (write inner products as cost @ assign: it compiles to a single
+    # linear term, whereas cp.sum(cp.multiply(cost, assign)) is much slower to
+    # canonicalize for large parameters; Model rewrites the latter form anyway)
+    m.minimize(cost @ assign)
+
+    # =============================================================================
+    # SOLVE
+    # =============================================================================
+
+    # A square assignment with a cost for every (worker, task) pair is a linear
+    # sum assignment problem, which the Hungarian method solves in O(n^3) without
+    # building the LP at all. Fall back to the LP for anything else.
+    n_workers, n_tasks = len(workers), len(tasks)
+    if n_workers == n_tasks and len(cost_df) == len(assignments):
+        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        assign_matrix = np.zeros((n_workers, n_tasks))
+        assign_matrix[row_ind, col_ind] = 1.0
+        assign.value = assign_matrix.ravel()
+        print("Solved with the Hungarian algorithm (scipy.optimize.linear_sum_assignment)")
+        print(f"Optimal cost: {cost_matrix[row_ind, col_ind].sum():g}")
+        solved_lp = False
+    else:
+        m.solve()
+        print("Solved as an LP")
+        solved_lp = True
+    print()
+
+    # =============================================================================
+    # RESULTS
+    # =============================================================================
+
+    # The model only has a status and objective value if the LP was solved
+    if solved_lp:
+        print("=== Model Summary ===")
+        m.print_summary()
+        print()
+
+    # Build the solution DataFrame from the non-zero entries of the value arrays
+    # (both indexed by Set.cross(workers, tasks), so they reshape to worker x task)
+    print("=== Solution as DataFrame ===")
+    worker_names = np.array(workers.to_list(), dtype=object)
+    task_names = np.array(tasks.to_list(), dtype=object)
+    assign_vals = np.asarray(assign.value).reshape(n_workers, n_tasks)
+    cost_vals = np.asarray(cost.value).reshape(n_workers, n_tasks)
+    rows, cols = np.nonzero(assign_vals > 0.5)
+    solution_df = pd.DataFrame(
+        {"worker": worker_names[rows], "task": task_names[cols], "cost": cost_vals[rows, cols]}
+    )
+    print(solution_df.to_string(index=False))
+    print()
+    print(f"Total cost: {solution_df['cost'].sum():g}")
+    print()
+
+    # Fancy table display
+    print("=== Assignment Matrix (Rich Table) ===")
+    print_variable(assign, show_zero=False, precision=0)
+
+    # =============================================================================
+    # SCENARIO SWEEP
+    # =============================================================================
+
+    # Re-solve the LP under 16 randomly perturbed cost matrices. solve_batch
+    # compiles the problem once and farms the scenarios out to worker processes,
+    # sending each one only its new cost values. A problem this small solves in
+    # milliseconds, so two workers are plenty; raise max_workers for larger models.
+    print("=== Cost Sweep (16 scenarios, +/-20% noise) ===")
+    rng = np.random.default_rng(0)
+    scenarios = [
+        {"cost": cost_matrix * rng.uniform(0.8, 1.2, size=cost_matrix.shape)} for _ in range(16)
+    ]
+    results = m.solve_batch(scenarios, max_workers=2)
+    sweep_costs = np.array([r["value"] for r in results])
+    baseline = assign_vals.ravel() > 0.5
+    n_same = sum(np.array_equal(r["variables"]["assign"] > 0.5, baseline) for r in results)
+    print(
+        f"Total cost: min {sweep_costs.min():.2f}, "
+        f"median {np.median(sweep_costs):.2f}, max {sweep_costs.max():.2f}"
+    )
+    print(f"Baseline assignment stays optimal in {n_same} of {len(results)} scenarios")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,7 @@ with additional operations like mean, count, any, and all.
 
 from __future__ import annotations
 
-from collections.abc import Hashable
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING
 
 import cvxpy as cp
 import numpy as np
@@ -24,17 +23,23 @@ def _infer_index(expr: cp.Expression) -> Set:
     """
     from cvxpy_or.sets import Parameter, Variable
 
-    indices: set[Set] = set()
+    found: dict[int, Set] = {}
 
     def walk(node):
         if isinstance(node, (Variable, Parameter)):
-            indices.add(node._set_index)
+            found[id(node._set_index)] = node._set_index
         if hasattr(node, "args"):
             for arg in node.args:
                 walk(arg)
 
     walk(expr)
 
+    # Only compare (and hash) Sets when there are several distinct objects,
+    # since hashing a CrossSet builds its elements
+    indices = list(found.values())
+    if len(indices) > 1:
+        indices = list(set(indices))
+
     if len(indices) == 0:
         raise TypeError("Cannot infer index: expression contains no Variable or Parameter.")
     if len(indices) > 1:
@@ -46,13 +51,20 @@ def _infer_index(expr: cp.Expression) -> Set:
 
 
 def _get_group_info(index: Set, positions: int | str | list[int] | list[str]):
-    """Get group keys and sizes for aggregation.
+    """Get group keys, per-element group rows and group sizes for aggregation.
+
+    Groups are numbered in order of first occurrence. The grouping itself is
+    done on the Set's integer position codes; tuple keys are only built for
+    the first element of each group.
 
     Returns
     -------
     tuple
-        (group_keys, key_to_row, group_sizes)
+        (group_keys, rows, group_sizes) where rows[j] is the group of
+        element j and group_sizes[g] the number of elements in group g.
     """
+    from cvxpy_or.sets import _group_rows
+
     # Normalize positions to list
     pos_list: list[int | str]
     if isinstance(positions, (int, str)):
@@ -61,75 +73,14 @@ def _get_group_info(index: Set, positions: int | str | list[int] | list[str]):
         pos_list = list(positions)
     pos_indices = [index._resolve_position(p) for p in pos_list]
 
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
-    # Find unique keys and count group sizes
-    group_keys: list[Hashable] = []
-    key_to_row: dict[Hashable, int] = {}
-    group_sizes: dict[Hashable, int] = {}
-
-    for elem in index:
-        key = get_key(cast(tuple[Any, ...], elem))
-        if key not in key_to_row:
-            key_to_row[key] = len(group_keys)
-            group_keys.append(key)
-            group_sizes[key] = 0
-        group_sizes[key] += 1
-
-    return group_keys, key_to_row, group_sizes, pos_indices
+    rows, n_groups = _group_rows(index, pos_indices)
+    group_sizes = np.bincount(rows, minlength=n_groups)
 
+    # Group ids follow first occurrence, so the first indices come out in group order
+    first = np.unique(rows, return_index=True)[1]
+    group_keys = index._keys_at(first, pos_indices)
 
-def _build_aggregation_matrix(index: Set, pos_indices: list[int]) -> sp.csr_matrix:
-    """Build a sparse aggregation matrix for sum_by.
-
-    Parameters
-    ----------
-    index : Set
-        The source index (must be compound).
-    pos_indices : list[int]
-        Positions to group by.
-
-    Returns
-    -------
-    sp.csr_matrix
-        Aggregation matrix of shape (n_groups, len(index)).
-    """
-
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
-    # Find unique keys (preserving order of first occurrence)
-    group_keys: list[Hashable] = []
-    seen: set[Hashable] = set()
-    for elem in index:
-        key = get_key(cast(tuple[Any, ...], elem))
-        if key not in seen:
-            group_keys.append(key)
-            seen.add(key)
-
-    # Build sparse matrix
-    n_groups = len(group_keys)
-    n_elements = len(index)
-
-    key_to_row = {k: i for i, k in enumerate(group_keys)}
-
-    rows: list[int] = []
-    cols: list[int] = []
-    data: list[float] = []
-
-    for j, elem in enumerate(index):
-        key = get_key(cast(tuple[Any, ...], elem))
-        row = key_to_row[key]
-        rows.append(row)
-        cols.append(j)
-        data.append(1.0)
-
-    return sp.csr_matrix((data, (rows, cols)), shape=(n_groups, n_elements))
+    return group_keys, rows, group_sizes
 
 
 def mean_by(
@@ -167,29 +118,16 @@ def mean_by(
             f"Use cp.mean() to compute mean of all elements."
         )
 
-    group_keys, key_to_row, group_sizes, pos_indices = _get_group_info(index, positions)
+    group_keys, rows, group_sizes = _get_group_info(index, positions)
 
     # Build mean matrix (like sum, but divided by group size)
     n_groups = len(group_keys)
     n_elements = len(index)
+    data = 1.0 / group_sizes[rows]
 
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
-    rows: list[int] = []
-    cols: list[int] = []
-    data: list[float] = []
-
-    for j, elem in enumerate(index):
-        key = get_key(cast(tuple[Any, ...], elem))
-        row = key_to_row[key]
-        rows.append(row)
-        cols.append(j)
-        data.append(1.0 / group_sizes[key])  # Divide by group size
-
-    agg_matrix = sp.csr_matrix((data, (rows, cols)), shape=(n_groups, n_elements))
+    # One entry per column, so build the CSC arrays directly
+    indptr = np.arange(n_elements + 1)
+    agg_matrix = sp.csc_matrix((data, rows, indptr), shape=(n_groups, n_elements))
     return agg_matrix @ expr
 
 
@@ -226,8 +164,8 @@ def count_by(
             f"Set '{index.name}' contains simple elements."
         )
 
-    group_keys, key_to_row, group_sizes, _ = _get_group_info(index, positions)
-    return np.array([group_sizes[k] for k in group_keys])
+    _, _, group_sizes = _get_group_info(index, positions)
+    return group_sizes
 
 
 def group_keys(
@@ -260,7 +198,7 @@ def group_keys(
             f"Set '{index.name}' contains simple elements."
         )
 
-    group_keys_list, _, _, _ = _get_group_info(index, positions)
+    group_keys_list, _, _ = _get_group_info(index, positions)
     return group_keys_list
 
 
@@ -308,22 +246,15 @@ def max_by(
             f"Set '{index.name}' contains simple elements."
         )
 
-    group_keys_list, key_to_row, _, pos_indices = _get_group_info(index, positions)
+    group_keys_list, rows, _ = _get_group_info(index, positions)
     n_groups = len(group_keys_list)
 
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
     # Create auxiliary variable for max per group
     max_var = cp.Variable(n_groups, name=aux_var_name)
 
     # Constraints: max_var[g] >= expr[i] for all i in group g
     constraints: list[cp.Constraint] = []
-    for j, elem in enumerate(index):
-        key = get_key(cast(tuple[Any, ...], elem))
-        row = key_to_row[key]
+    for j, row in enumerate(rows.tolist()):
         constraints.append(max_var[row] >= expr[j])
 
     return max_var, constraints
@@ -373,22 +304,15 @@ def min_by(
             f"Set '{index.name}' contains simple elements."
         )
 
-    group_keys_list, key_to_row, _, pos_indices = _get_group_info(index, positions)
+    group_keys_list, rows, _ = _get_group_info(index, positions)
     n_groups = len(group_keys_list)
 
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
     # Create auxiliary variable for min per group
     min_var = cp.Variable(n_groups, name=aux_var_name)
 
     # Constraints: min_var[g] <= expr[i] for all i in group g
     constraints: list[cp.Constraint] = []
-    for j, elem in enumerate(index):
-        key = get_key(cast(tuple[Any, ...], elem))
-        row = key_to_row[key]
+    for j, row in enumerate(rows.tolist()):
         constraints.append(min_var[row] <= expr[j])
 
     return min_var, constraints
@@ -432,5 +356,5 @@ def sum_by_expr(
         pos_list = list(positions)
     pos_indices = [index._resolve_position(p) for p in pos_list]
 
-    agg_matrix = _build_aggregation_matrix(index, pos_indices)
+    agg_matrix = index._aggregation_matrix(tuple(pos_indices))
     return agg_matrix @ expr
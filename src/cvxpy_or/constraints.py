@@ -6,11 +6,13 @@ in operations research problems.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 import cvxpy as cp
 import numpy as np
 
+from cvxpy_or.sets import _factorize_column
+
 if TYPE_CHECKING:
     from cvxpy_or.sets import Parameter, Variable
 
@@ -360,26 +362,26 @@ def flow_balance(
     src_idx = index._resolve_position(source_pos)
     sink_idx = index._resolve_position(sink_pos)
 
-    nodes: set[Any] = set()
-    for elem in index:
-        elem_tuple = cast(tuple[Any, ...], elem)
-        nodes.add(elem_tuple[src_idx])
-        nodes.add(elem_tuple[sink_idx])
+    # Number the nodes of both columns together and compare integer codes:
+    # comparing the raw columns against a node would broadcast tuple labels
+    # such as grid coordinates instead of matching them whole
+    n_arcs = len(index)
+    codes, node_values = _factorize_column(
+        np.concatenate([index._column(src_idx), index._column(sink_idx)])
+    )
+    src_codes, sink_codes = codes[:n_arcs], codes[n_arcs:]
+    nodes: list[Any] = node_values.tolist()
 
     constraints: list[cp.Constraint] = []
 
     # For each node: outflow - inflow = net_supply
-    for node in nodes:
+    for code, node in enumerate(nodes):
         # Outflow: sum of flows where this node is source
-        outflow_mask = np.array(
-            [1.0 if cast(tuple[Any, ...], elem)[src_idx] == node else 0.0 for elem in index]
-        )
+        outflow_mask = (src_codes == code).astype(float)
         outflow = outflow_mask @ flow_var
 
         # Inflow: sum of flows where this node is sink
-        inflow_mask = np.array(
-            [1.0 if cast(tuple[Any, ...], elem)[sink_idx] == node else 0.0 for elem in index]
-        )
+        inflow_mask = (sink_codes == code).astype(float)
         inflow = inflow_mask @ flow_var
 
         # Net supply
@@ -9,6 +9,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Callable
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
@@ -92,12 +93,14 @@ def variable_table(
     var_name = _get_name(var)
     title = title or f"Variable: {var_name}"
 
+    # Convert the values to Python floats once rather than unboxing per element
+    values = np.asarray(var.value, dtype=np.float64).ravel().tolist()
+
+    # Elements are stored in position order, so pair them with values directly
     rows = []
-    for elem in index:
+    for elem, value in zip(index._elements, values):
         if filter_fn is not None and not filter_fn(elem):
             continue
-        pos = index.position(elem)
-        value = float(var.value[pos])
         if not show_zero and abs(value) < 1e-6:
             continue
         rows.append((elem, value))
@@ -141,12 +144,14 @@ def parameter_table(
     param_name = _get_name(param)
     title = title or f"Parameter: {param_name}"
 
+    # Convert the values to Python floats once rather than unboxing per element
+    values = np.asarray(param.value, dtype=np.float64).ravel().tolist()
+
+    # Elements are stored in position order, so pair them with values directly
     rows = []
-    for elem in index:
+    for elem, value in zip(index._elements, values):
         if filter_fn is not None and not filter_fn(elem):
             continue
-        pos = index.position(elem)
-        value = float(param.value[pos])
         rows.append((elem, value))
 
     if not rows:
@@ -188,13 +193,12 @@ def _format_rich_table(
 
     table.add_column("value", justify="right")
 
-    # Add rows
+    # Add rows, passing cells straight through instead of building a list per row
     for elem, value in rows:
         if isinstance(elem, tuple):
-            row_values = [str(e) for e in elem] + [format_value(value, precision)]
+            table.add_row(*map(str, elem), format_value(value, precision))
         else:
-            row_values = [str(elem), format_value(value, precision)]
-        table.add_row(*row_values)
+            table.add_row(str(elem), format_value(value, precision))
 
     # Render to string
     with console.capture() as capture:
@@ -6,10 +6,17 @@ problems with set-based indexing.
 
 from __future__ import annotations
 
-from collections.abc import Hashable
+from collections.abc import Hashable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import cast
 
 import cvxpy as cp
+import numpy as np
 import pandas as pd
+from cvxpy.atoms.affine.add_expr import AddExpression
+from cvxpy.atoms.affine.binary_operators import multiply
+from cvxpy.atoms.affine.sum import Sum
 
 from cvxpy_or.display import solution_summary
 from cvxpy_or.sets import Parameter, Set, Variable
@@ -56,15 +63,19 @@ class Model:
     >>> m.print_solution()
     """
 
-    def __init__(self, name: str | None = None):
+    def __init__(self, name: str | None = None, *, default_solver: str | None = None):
         """Initialize a new Model.
 
         Parameters
         ----------
         name : str, optional
             Name for this model.
+        default_solver : str, optional
+            Solver used by solve() when no ``solver`` is passed, e.g.
+            ``cp.HIGHS`` for LPs. If None, CVXPY picks the solver.
         """
         self._name = name or "model"
+        self._default_solver = default_solver
         self._variables: dict[str, Variable] = {}
         self._parameters: dict[str, Parameter] = {}
         self._constraints: dict[str, list[cp.Constraint]] = {}
@@ -147,7 +158,7 @@ class Model:
     def add_parameter(
         self,
         index: Set,
-        data: dict[Hashable, float] | None = None,
+        data: dict[Hashable, float] | np.ndarray | None = None,
         *,
         name: str | None = None,
         **kwargs,
@@ -158,8 +169,8 @@ class Model:
         ----------
         index : Set
             The index set for this parameter.
-        data : dict, optional
-            Initial data as {key: value}.
+        data : dict or np.ndarray, optional
+            Initial data as {key: value}, or an array in index order.
         name : str, optional
             Name for the parameter.
         **kwargs
@@ -202,6 +213,7 @@ class Model:
             self._constraints[name] = constraint
         else:
             self._constraints[name] = [constraint]
+        self._problem = None
 
     def add_constraints(
         self,
@@ -213,6 +225,7 @@ class Model:
         Alias for add_constraint() with a list.
         """
         self._constraints[name] = constraints
+        self._problem = None
 
     def minimize(self, expr: cp.Expression) -> None:
         """Set the objective to minimize.
@@ -226,8 +239,9 @@ class Model:
         --------
         >>> m.minimize(cost @ ship)
         """
-        self._objective = expr
+        self._objective = _prefer_matmul(expr)
         self._sense = "minimize"
+        self._problem = None
 
     def maximize(self, expr: cp.Expression) -> None:
         """Set the objective to maximize.
@@ -241,8 +255,9 @@ class Model:
         --------
         >>> m.maximize(profit @ sales)
         """
-        self._objective = expr
+        self._objective = _prefer_matmul(expr)
         self._sense = "maximize"
+        self._problem = None
 
     def _build_problem(self) -> cp.Problem:
         """Build the CVXPY Problem from model components."""
@@ -264,10 +279,16 @@ class Model:
     def solve(self, **kwargs) -> str:
         """Solve the optimization problem.
 
+        The CVXPY Problem is built on the first call and reused until a
+        constraint or the objective changes. Re-solving after only updating
+        Parameter values (e.g. with ``set_data``) therefore skips CVXPY's
+        canonicalization, provided the problem is DPP-compliant.
+
         Parameters
         ----------
         **kwargs
-            Arguments passed to CVXPY's solve().
+            Arguments passed to CVXPY's solve(). If ``solver`` is not given,
+            the model's ``default_solver`` is used.
 
         Returns
         -------
@@ -278,8 +299,13 @@ class Model:
         --------
         >>> status = m.solve()
         >>> status = m.solve(solver=cp.GUROBI, verbose=True)
+        >>> cost.set_data(new_costs)
+        >>> status = m.solve()  # reuses the compiled problem
         """
-        self._problem = self._build_problem()
+        if self._default_solver is not None:
+            kwargs.setdefault("solver", self._default_solver)
+        if self._problem is None:
+            self._problem = self._build_problem()
         self._problem.solve(**kwargs)
         self._status = self._problem.status
         # CVXPY's Problem.value can be various numeric types; we store as float
@@ -287,6 +313,73 @@ class Model:
         self._value = float(prob_value) if prob_value is not None else None  # type: ignore[arg-type]
         return self._status
 
+    def solve_batch(
+        self,
+        updates: Sequence[dict[str, dict | np.ndarray]],
+        *,
+        max_workers: int | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """Solve independent scenarios of the model in parallel.
+
+        The problem is canonicalized once in this process and sent to each
+        worker process a single time; each scenario then ships only its
+        parameter values. Every scenario re-solves the cached problem, so the
+        model must be DPP-compliant for this to pay off. The model's own
+        status, value and variable values are left untouched.
+
+        Parameters
+        ----------
+        updates : sequence of dict
+            One dict per scenario, mapping parameter names to new data (a
+            dict or numpy array, as accepted by ``Parameter.set_data``).
+            Parameters not mentioned keep their current values.
+        max_workers : int, optional
+            Number of worker processes. Defaults to the CPU count.
+        **kwargs
+            Arguments passed to CVXPY's solve(). If ``solver`` is not given,
+            the model's ``default_solver`` is used.
+
+        Returns
+        -------
+        list of dict
+            One result per scenario, in order, with keys ``"status"``,
+            ``"value"`` and ``"variables"`` (variable name -> numpy array).
+
+        Examples
+        --------
+        >>> scenarios = [{'cost': cost_matrix * s} for s in (0.9, 1.0, 1.1)]
+        >>> results = m.solve_batch(scenarios, max_workers=3)
+        >>> [r['value'] for r in results]
+        """
+        if self._default_solver is not None:
+            kwargs.setdefault("solver", self._default_solver)
+        problem = self._build_problem()
+        # Populate CVXPY's parameter cache before pickling so workers skip
+        # canonicalization. A fresh problem is used because solver results
+        # attached after a solve cannot be pickled.
+        problem.get_problem_data(kwargs.get("solver"))
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(problem,)
+        ) as executor:
+            raw = list(executor.map(_solve_scenario, updates, repeat(kwargs)))
+
+        # Variable ids survive pickling, so map results back by id
+        names_by_id = {var.id: name for name, var in self._variables.items()}
+        return [
+            {
+                "status": status,
+                "value": value,
+                "variables": {
+                    names_by_id[var_id]: var_value
+                    for var_id, var_value in values.items()
+                    if var_id in names_by_id
+                },
+            }
+            for status, value, values in raw
+        ]
+
     def summary(self) -> str:
         """Return a summary of the model.
 
@@ -445,3 +538,61 @@ class Model:
         n_vars = len(self._variables)
         n_constraints = len(self._constraints)
         return f"Model(name={self._name!r}, variables={n_vars}, constraints={n_constraints})"
+
+
+def _prefer_matmul(expr: cp.Expression) -> cp.Expression:
+    """Rewrite ``cp.sum(cp.multiply(param, var))`` terms as ``param @ var``.
+
+    Both forms are the same inner product, but under DPP the elementwise
+    product canonicalizes to an n x n parameter tensor while the matmul stays
+    a single linear term (roughly 10x faster to compile at n = 3000). The
+    rewrite is applied to the expression itself and to the terms of a
+    top-level sum; anything else is returned unchanged.
+    """
+    if isinstance(expr, AddExpression):
+        terms = [_prefer_matmul(arg) for arg in expr.args]
+        if all(new is old for new, old in zip(terms, expr.args)):
+            return expr
+        return cast(cp.Expression, sum(terms[1:], terms[0]))
+
+    if not (isinstance(expr, Sum) and expr.axis is None and isinstance(expr.args[0], multiply)):
+        return expr
+    lhs, rhs = expr.args[0].args
+    if isinstance(rhs, Parameter) and isinstance(lhs, Variable):
+        lhs, rhs = rhs, lhs
+    if (
+        isinstance(lhs, Parameter)
+        and isinstance(rhs, Variable)
+        and lhs._set_index == rhs._set_index
+    ):
+        return lhs @ rhs
+    return expr
+
+
+# Problem held by each solve_batch worker process, set once by _init_worker
+_worker_problem: cp.Problem | None = None
+
+
+def _init_worker(problem: cp.Problem) -> None:
+    """Store the pre-compiled problem in a solve_batch worker process."""
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _solve_scenario(
+    update: dict[str, dict | np.ndarray], solve_kwargs: dict
+) -> tuple[str, float | None, dict[int, np.ndarray | None]]:
+    """Apply one scenario's parameter values and solve the worker's problem."""
+    problem = cast(cp.Problem, _worker_problem)
+    params = {p.name(): p for p in problem.parameters()}
+    for name, data in update.items():
+        if name not in params:
+            raise KeyError(f"Parameter '{name}' not found. Available: {list(params)}")
+        param = params[name]
+        if isinstance(param, Parameter):
+            param.set_data(data)
+        else:
+            param.value = data
+    problem.solve(**solve_kwargs)
+    value = float(problem.value) if problem.value is not None else None  # type: ignore[arg-type]
+    return problem.status, value, {var.id: var.value for var in problem.variables()}
@@ -6,9 +6,10 @@ pandas DataFrames and exporting Variable values back to DataFrames.
 
 from __future__ import annotations
 
-from collections.abc import Hashable, Sequence
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -81,9 +82,17 @@ def set_from_dataframe(
     """
     from cvxpy_or.sets import Set as SetClass
 
-    # Extract unique tuples
-    tuples = df[list(columns)].drop_duplicates().itertuples(index=False, name=None)
-    elements = list(tuples)
+    # Factorize each column once. Rows are deduplicated on the integer codes,
+    # and the tuples are rebuilt from each column's distinct values, so equal
+    # labels share a single object (less memory, and hashing/equality checks
+    # in position lookups hit the cached str hash and identity fast path)
+    factorized = [pd.factorize(df[col], use_na_sentinel=False) for col in columns]
+    row_key = factorized[0][0]
+    for codes, uniques in factorized[1:]:
+        row_key = pd.factorize(row_key * len(uniques) + codes)[0]
+    # Groups are numbered by first appearance, so their first rows come out sorted
+    first = np.unique(row_key, return_index=True)[1]
+    elements = list(zip(*(uniques.take(codes[first]).tolist() for codes, uniques in factorized)))
 
     # Use column names as position names if not provided
     if names is None:
@@ -115,18 +124,20 @@ def set_from_index(
     """
     from cvxpy_or.sets import Set as SetClass
 
+    elements = df.index.to_list()
     if isinstance(df.index, pd.MultiIndex):
-        elements = list(df.index)
         if names is None:
             # Convert Hashable names to strings
             names = tuple(
                 str(n) if n is not None else f"level_{i}" for i, n in enumerate(df.index.names)
             )
-    else:
-        elements = list(df.index)
 
     set_name = name or (str(df.index.name) if df.index.name is not None else None)
-    return SetClass(elements, name=set_name, names=names)
+    result = SetClass(elements, name=set_name, names=names)
+    if df.index.is_unique:
+        # The index already lists the elements in order; reuse it for lookups
+        result._index = df.index
+    return result
 
 
 def parameter_from_dataframe(
@@ -172,19 +183,23 @@ def parameter_from_dataframe(
         index_cols = [index_cols]
 
     # Create index if not provided
-    if index is None:
+    # (a single column gives a simple Set, matching the scalar keys below)
+    if index is None and len(index_cols) == 1:
+        index = set_from_series(df[index_cols[0]], name=name)
+    elif index is None:
         index = set_from_dataframe(df, index_cols, name=name)
 
-    # Build data dict
-    data: dict[Hashable, float] = {}
-    for _, row in df.iterrows():
-        if len(index_cols) == 1:
-            key: Hashable = cast(Hashable, row[index_cols[0]])
-        else:
-            key = tuple(row[col] for col in index_cols)
-        data[key] = float(row[value_col])
+    # Look up every row's position with one get_indexer call and scatter the
+    # values into index order, without building tuple keys or a data dict
+    # (later rows win on duplicates; elements missing from df stay 0)
+    if len(index_cols) == 1:
+        keys = pd.Index(df[index_cols[0]])
+    else:
+        keys = pd.MultiIndex.from_frame(df.loc[:, list(index_cols)])
+    values = np.zeros(len(index))
+    values[index.positions(keys)] = df[value_col].to_numpy(dtype=np.float64)
 
-    return ParameterClass(index, data=data, name=name)
+    return ParameterClass(index, data=values, name=name)
 
 
 def parameter_from_series(
@@ -216,24 +231,30 @@ def parameter_from_series(
     from cvxpy_or.sets import Parameter as ParameterClass
     from cvxpy_or.sets import Set as SetClass
 
+    # Repeated labels follow dict semantics, as in parameter_from_dataframe:
+    # each label keeps its first position and takes its last value
+    if not series.index.is_unique:
+        labels = series.index[~series.index.duplicated(keep="first")]
+        series = series.loc[~series.index.duplicated(keep="last")].reindex(labels)
+
     # Create index if not provided
     if index is None:
+        elements = series.index.to_list()
         if isinstance(series.index, pd.MultiIndex):
-            elements = list(series.index)
             idx_names: tuple[str, ...] | None = tuple(
                 str(n) if n is not None else f"level_{i}" for i, n in enumerate(series.index.names)
             )
         else:
-            elements = list(series.index)
             idx_names = None
         set_name = str(series.name) if series.name is not None else name
         index = SetClass(elements, name=set_name, names=idx_names)
 
-    # Build data dict - convert series to dict with proper types
-    data: dict[Hashable, float] = {k: float(v) for k, v in series.items()}
+    # Scatter the values into index order as an array, skipping the dict detour
+    values = np.zeros(len(index))
+    values[index.positions(series.index)] = series.to_numpy(dtype=np.float64)
 
     param_name = name or (str(series.name) if series.name is not None else None)
-    return ParameterClass(index, data=data, name=param_name)
+    return ParameterClass(index, data=values, name=param_name)
 
 
 def variable_to_dataframe(
@@ -271,29 +292,7 @@ def variable_to_dataframe(
     if var.value is None:
         raise ValueError(f"Variable '{var.name}' has no solution. Solve the problem first.")
 
-    index = var._set_index
-
-    # Build rows
-    rows = []
-    for elem in index:
-        pos = index.position(elem)
-        value = float(var.value[pos])
-        if isinstance(elem, tuple):
-            row = list(elem) + [value]
-        else:
-            row = [elem, value]
-        rows.append(row)
-
-    # Build column names
-    if index._is_compound and index._names:
-        columns = list(index._names) + [value_col]
-    elif index._is_compound:
-        first_elem = cast(tuple[Any, ...], index._elements[0])
-        columns = [f"pos_{i}" for i in range(len(first_elem))] + [value_col]
-    else:
-        columns = [index.name or "index", value_col]
-
-    return pd.DataFrame(rows, columns=columns)  # type: ignore[arg-type]
+    return _values_to_dataframe(var._set_index, var.value, value_col)
 
 
 def parameter_to_dataframe(
@@ -319,26 +318,29 @@ def parameter_to_dataframe(
             f"Parameter '{param.name}' has no data. Set data with param.set_data({{...}})."
         )
 
-    index = param._set_index
+    return _values_to_dataframe(param._set_index, param.value, value_col)
+
+
+def _values_to_dataframe(index: Set, values: Any, value_col: str) -> pd.DataFrame:
+    """Build a DataFrame of index columns plus a value column.
 
-    # Build rows
-    rows = []
-    for elem in index:
-        pos = index.position(elem)
-        value = float(param.value[pos])
-        if isinstance(elem, tuple):
-            row = list(elem) + [value]
+    The Set's elements are stored in position order, so the index columns are
+    built from them in one go and the value array is attached as-is.
+    """
+    if index._is_compound:
+        if index._names:
+            columns = list(index._names)
         else:
-            row = [elem, value]
-        rows.append(row)
-
-    # Build column names
-    if index._is_compound and index._names:
-        columns = list(index._names) + [value_col]
-    elif index._is_compound:
-        first_elem = cast(tuple[Any, ...], index._elements[0])
-        columns = [f"pos_{i}" for i in range(len(first_elem))] + [value_col]
+            first_elem = cast(tuple[Any, ...], index._elements[0])
+            columns = [f"pos_{i}" for i in range(len(first_elem))]
+        df = pd.DataFrame.from_records(index._elements, columns=columns)
     else:
-        columns = [index.name or "index", value_col]
+        df = pd.DataFrame({index.name or "index": index._elements})
 
-    return pd.DataFrame(rows, columns=columns)  # type: ignore[arg-type]
+    if value_col in df.columns:
+        raise ValueError(
+            f"value_col '{value_col}' clashes with an index column of '{index.name}'. "
+            f"Pass a different value_col."
+        )
+    df[value_col] = np.asarray(values, dtype=np.float64).ravel()
+    return df
@@ -28,12 +28,17 @@ Example
 
 from __future__ import annotations
 
-from collections.abc import Hashable, Iterable, Sequence
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from functools import cached_property, reduce
 from itertools import product as itertools_product
+from math import prod
+from operator import itemgetter
 from typing import Any, Callable, cast
+from weakref import WeakValueDictionary
 
 import cvxpy as cp
 import numpy as np
+import pandas as pd
 import scipy.sparse as sp
 
 # Type alias for set elements - can be simple values or tuples
@@ -78,6 +83,16 @@ def where(
     """
     index = _infer_index(expr)
     mask = _build_where_mask(cond, index, kwargs)
+    keep = np.flatnonzero(mask)
+    n = len(mask)
+    # A mask that keeps everything needs no multiply node at all
+    if len(keep) == n and (mask == 1.0).all():
+        return expr
+    if len(keep) < 0.5 * n:
+        # Mostly zeros: a sparse diagonal selector holds only the kept entries
+        # (empty if nothing matches, which still keeps expr's leaves in the tree)
+        selector = sp.csc_matrix((mask[keep], (keep, keep)), shape=(n, n))
+        return selector @ expr
     return cp.multiply(mask, expr)
 
 
@@ -133,8 +148,8 @@ def sum_by(
         pos_list = list(positions)
     pos_indices = [index._resolve_position(p) for p in pos_list]
 
-    # Build aggregation matrix
-    agg_matrix = _build_aggregation_matrix(index, pos_indices)
+    # Aggregation matrix (cached on the Set, so repeated sum_by calls reuse it)
+    agg_matrix = index._aggregation_matrix(tuple(pos_indices))
 
     return agg_matrix @ expr
 
@@ -180,15 +195,35 @@ class Set:
         names: Sequence[str] | None = None,
     ):
         self._elements = list(elements)
-        self._name = name or f"Set_{id(self)}"
         self._pos = {e: i for i, e in enumerate(self._elements)}
         self._is_compound = len(self._elements) > 0 and isinstance(self._elements[0], tuple)
+        arity = len(cast(tuple[Any, ...], self._elements[0])) if self._is_compound else 0
+        self._init_attributes(name, names, arity)
+
+    def _init_attributes(self, name: str | None, names: Sequence[str] | None, arity: int) -> None:
+        """Set the name, position names and lazily built caches."""
+        self._name = name or f"Set_{id(self)}"
         self._names = tuple(names) if names else None
+        # Position of each name (the first, if a name repeats)
+        self._name_to_pos: dict[Hashable, int] = {}
+        for i, position_name in enumerate(self._names or ()):
+            self._name_to_pos.setdefault(position_name, i)
+        self._hash: int | None = None
+        # Results of Set.cross() with this Set as the first factor, held weakly
+        self._cross_cache: WeakValueDictionary[tuple, Set] = WeakValueDictionary()
+        # Integer codes per position of a compound index, built on first use
+        self._codes: np.ndarray | None = None
+        # Distinct values at each position, in code order
+        self._levels: list[np.ndarray] | None = None
+        # Elements as a pandas Index, built on first use
+        self._index: pd.Index | None = None
+        # sum_by aggregation matrices keyed by the grouped positions
+        self._agg_cache: dict[tuple[int, ...], sp.csc_matrix] = {}
+        # where() masks for keyword filters, keyed by the resolved filters
+        self._mask_cache: dict[frozenset, np.ndarray] = {}
 
         # Validate names match arity of compound index
         if self._names and self._is_compound:
-            first_elem = cast(tuple[Any, ...], self._elements[0])
-            arity = len(first_elem)
             if len(self._names) != arity:
                 raise ValueError(
                     f"names has {len(self._names)} elements but index tuples have {arity} positions"
@@ -227,16 +262,139 @@ class Set:
         KeyError
             If the element is not in the index.
         """
-        if elem not in self._pos:
-            raise KeyError(f"Element {elem!r} not in index '{self._name}'")
-        return self._pos[elem]
+        try:
+            return self._pos[elem]
+        except KeyError:
+            raise KeyError(f"Element {elem!r} not in index '{self._name}'") from None
+
+    def _find(self, elem: Any) -> int | None:
+        """Return the position of `elem`, or None if it is not an element."""
+        try:
+            return self._pos.get(elem)
+        except TypeError:  # unhashable, so not an element
+            return None
+
+    def positions(self, elems: Iterable[Hashable]) -> np.ndarray:
+        """Return the integer positions of many elements at once.
+
+        Equivalent to ``[self.position(e) for e in elems]`` but collected
+        straight into an array. A pandas Index, or a NumPy array of native
+        dtype for a simple Set, is matched against the Set's own cached Index
+        with a single vectorized ``get_indexer`` call; other iterables hold
+        Python objects that are cheapest to look up in the position dict
+        directly.
+
+        Parameters
+        ----------
+        elems : iterable of Hashable or pd.Index
+            The elements to look up. A pandas MultiIndex is accepted for
+            compound Sets and used as-is.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of positions, one per element.
+
+        Raises
+        ------
+        KeyError
+            If any element is not in the index.
+
+        Examples
+        --------
+        >>> routes.positions([('W2', 'C1'), ('W1', 'C2')])
+        array([2, 1])
+        """
+        if isinstance(elems, np.ndarray) and elems.dtype != object and not self._is_compound:
+            # A native array (ints, strings) is hashed in C against the cached Index
+            elems = pd.Index(elems)
+        if not isinstance(elems, pd.Index):
+            pos = self._pos
+            try:
+                return np.fromiter((pos[e] for e in elems), dtype=np.intp)
+            except KeyError as err:
+                self.position(err.args[0])  # raises with the index name
+                raise
+        result = self._pandas_index().get_indexer(elems)
+        if len(result) and result.min() < 0:
+            missing = elems[int(np.argmin(result))]
+            raise KeyError(f"Element {missing!r} not in index '{self._name}'")
+        return result
+
+    def _position_codes(self) -> np.ndarray:
+        """Integer-encode each position of a compound index.
+
+        Returns an array of shape (len(self), arity) whose column k numbers
+        the distinct values at position k in order of first occurrence; those
+        values are kept in ``self._levels``. The encoding is computed once and
+        cached on the Set.
+        """
+        if self._codes is None:
+            elements = cast(list[tuple[Any, ...]], self._elements)
+            n = len(elements)
+            arity = len(elements[0])
+            factorized = [
+                _factorize_column(np.fromiter(map(itemgetter(k), elements), dtype=object, count=n))
+                for k in range(arity)
+            ]
+            self._levels = [levels for _, levels in factorized]
+            self._codes = np.column_stack([codes for codes, _ in factorized]).astype(
+                np.intp, copy=False
+            )
+        return self._codes
+
+    def _column(self, pos: int) -> np.ndarray:
+        """Return the values at position `pos` of every element as an array.
+
+        Taken from the cached codes and distinct values, so the tuples are
+        not walked again for each position.
+        """
+        codes = self._position_codes()
+        return cast(list[np.ndarray], self._levels)[pos][codes[:, pos]]
+
+    def _keys_at(self, elem_positions: np.ndarray, pos_indices: Sequence[int]) -> list[Hashable]:
+        """Return the keys at `pos_indices` of the elements at `elem_positions`.
+
+        A single position gives its values, several give tuples of them.
+        """
+        codes = self._position_codes()
+        levels = cast(list[np.ndarray], self._levels)
+        columns = [levels[p][codes[elem_positions, p]].tolist() for p in pos_indices]
+        if len(columns) == 1:
+            return columns[0]
+        return list(zip(*columns))
+
+    def _pandas_index(self) -> pd.Index:
+        """Return the elements as a pandas Index, built once and cached.
+
+        Compound Sets give a MultiIndex, so positions of many keys can be
+        found with a single ``get_indexer`` call.
+        """
+        if self._index is None:
+            if self._is_compound:
+                self._index = pd.MultiIndex.from_tuples(cast(list[tuple[Any, ...]], self._elements))
+            else:
+                self._index = pd.Index(self._elements, tupleize_cols=False)
+        return self._index
+
+    def _aggregation_matrix(self, pos_indices: tuple[int, ...]) -> sp.csc_matrix:
+        """Return the sum_by matrix grouping on `pos_indices`, built once per Set."""
+        matrix = self._agg_cache.get(pos_indices)
+        if matrix is None:
+            matrix = _build_aggregation_matrix(self, list(pos_indices))
+            self._agg_cache[pos_indices] = matrix
+        return matrix
 
     def _resolve_position(self, key: int | str) -> int:
         """Convert a string name or int to a position index."""
-        if isinstance(key, int):
+        if type(key) is int:
+            return key
+        try:
+            return self._name_to_pos[key]
+        except (KeyError, TypeError):
+            pass
+        if isinstance(key, int):  # int subclasses such as bool
             return key
-        if self._names and key in self._names:
-            return self._names.index(key)
         raise KeyError(f"Unknown position name: {key!r}. Available names: {self._names}")
 
     def __eq__(self, other: object) -> bool:
@@ -246,8 +404,10 @@ class Set:
         return self._elements == other._elements
 
     def __hash__(self) -> int:
-        """Hash based on elements (as tuple)."""
-        return hash(tuple(self._elements))
+        """Hash based on elements (as tuple), computed once."""
+        if self._hash is None:
+            self._hash = hash(tuple(self._elements))
+        return self._hash
 
     def __or__(self, other: Set) -> Set:
         """Union of two Sets (preserves order, self first).
@@ -459,7 +619,10 @@ class Set:
         Returns
         -------
         Set
-            A new Set containing all combinations as tuples.
+            A Set containing all combinations as tuples. Repeated calls with
+            the same arguments return the same (cached) Set. The tuples are
+            not built up front: positions and membership are computed from
+            the factors (see CrossSet).
 
         Examples
         --------
@@ -474,15 +637,132 @@ class Set:
         if len(indices) < 2:
             raise ValueError("cross() requires at least 2 indices")
 
-        elements = list(itertools_product(*[idx._elements for idx in indices]))
+        # Sets are immutable, so the product only needs to be built once per
+        # combination of factors. The key uses factor identity, so hashing it
+        # never materializes a lazy factor's elements; the ids stay valid
+        # because a cached product keeps its factors alive, and the cache
+        # only holds products weakly so it does not grow without bound.
+        cache_key = (tuple(map(id, indices[1:])), name, tuple(names) if names else None)
+        cache = indices[0]._cross_cache
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Auto-generate names from source index names if not provided
+        source_names = tuple(idx._name for idx in indices)
         if names is None:
-            source_names = [idx._name for idx in indices]
             if all(n is not None for n in source_names):
-                names = tuple(source_names)
+                names = source_names
+
+        result = CrossSet(indices, name=name, names=names)
+        cache[cache_key] = result
+        return result
+
 
-        return Set(elements, name=name, names=names)
+class CrossSet(Set):
+    """The cross product of several Sets, stored by its factors.
+
+    Returned by ``Set.cross``. The length, element positions, membership and
+    per-position codes follow arithmetically from the factors, so the element
+    tuples and their position dict are only built if something needs them
+    (iterating, comparing, exporting, ...).
+
+    Parameters
+    ----------
+    sources : Sequence[Set]
+        The factors, in position order.
+    name : str, optional
+        A name for this index set.
+    names : Sequence[str], optional
+        Names for the positions.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Set],
+        name: str | None = None,
+        names: Sequence[str] | None = None,
+    ):
+        self._sources = tuple(sources)
+        sizes = [len(src) for src in self._sources]
+        self._size = prod(sizes)
+        # Row-major strides: position k advances the flat position by strides[k]
+        self._strides = tuple(prod(sizes[k + 1 :]) for k in range(len(sizes)))
+        self._is_compound = self._size > 0
+        self._init_attributes(name, names, len(self._sources))
+
+    @cached_property
+    def _elements(self) -> list[Hashable]:  # type: ignore[override]
+        return list(itertools_product(*[src._elements for src in self._sources]))
+
+    @cached_property
+    def _pos(self) -> dict[Hashable, int]:  # type: ignore[override]
+        return {e: i for i, e in enumerate(self._elements)}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return itertools_product(*[src._elements for src in self._sources])
+
+    def __contains__(self, elem: Hashable) -> bool:
+        if not isinstance(elem, tuple) or len(elem) != len(self._sources):
+            return False
+        return all(e in src._pos for e, src in zip(elem, self._sources))
+
+    def position(self, elem: Hashable) -> int:
+        """Return the integer position of an element.
+
+        Raises
+        ------
+        KeyError
+            If the element is not in the index.
+        """
+        if elem not in self:
+            raise KeyError(f"Element {elem!r} not in index '{self._name}'")
+        elem_tuple = cast(tuple[Any, ...], elem)
+        return sum(
+            src._pos[e] * stride for e, src, stride in zip(elem_tuple, self._sources, self._strides)
+        )
+
+    def _find(self, elem: Any) -> int | None:
+        try:
+            return self.position(elem)
+        except (KeyError, TypeError):
+            return None
+
+    def positions(self, elems: Iterable[Hashable]) -> np.ndarray:
+        if isinstance(elems, pd.Index):
+            return super().positions(elems)
+        keys: list[Any] = list(elems)
+        arity = len(self._sources)
+        if set(map(type, keys)) == {tuple} and set(map(len, keys)) == {arity}:
+            # Look up each position's values in its factor, then combine with the strides
+            result = np.zeros(len(keys), dtype=np.intp)
+            try:
+                for k, (src, stride) in enumerate(zip(self._sources, self._strides)):
+                    result += src.positions(map(itemgetter(k), keys)) * stride
+                return result
+            except KeyError:
+                pass  # report the missing element below
+        return np.fromiter(map(self.position, keys), dtype=np.intp, count=len(keys))
+
+    def _position_codes(self) -> np.ndarray:
+        if self._codes is None:
+            flat = np.arange(self._size, dtype=np.intp)
+            self._codes = np.column_stack(
+                [(flat // stride) % len(src) for src, stride in zip(self._sources, self._strides)]
+            )
+            self._levels = [
+                _native_column(np.fromiter(src._elements, dtype=object, count=len(src)))
+                for src in self._sources
+            ]
+        return self._codes
+
+    def _pandas_index(self) -> pd.Index:
+        if self._index is None and not any(src._is_compound for src in self._sources):
+            self._index = pd.MultiIndex.from_product([src._elements for src in self._sources])
+        return super()._pandas_index()
 
 
 class Variable(cp.Variable):
@@ -541,8 +821,10 @@ class Variable(cp.Variable):
         If key is in the Set, returns the element at that position.
         Otherwise, delegates to standard CVXPY indexing (slices, etc.).
         """
-        if key in self._set_index:
-            return super().__getitem__(self._set_index.position(key))
+        if not isinstance(key, (slice, list, np.ndarray)):
+            pos = self._set_index._find(key)
+            if pos is not None:
+                return super().__getitem__(pos)
         return super().__getitem__(key)
 
     def get_value(self, key: Hashable) -> float | None:
@@ -558,9 +840,30 @@ class Variable(cp.Variable):
         float | None
             The value at that index, or None if not solved yet.
         """
-        if self.value is None:
+        value = self.value
+        if value is None:
             return None
-        return float(self.value[self._set_index.position(key)])
+        return float(value[self._set_index.position(key)])
+
+    def values_as_dict(self) -> dict[Hashable, float] | None:
+        """Get all solved values as a dict keyed by index element.
+
+        Build this once before looping over many elements; each lookup is
+        then a plain dict access instead of a get_value() call.
+
+        Returns
+        -------
+        dict[Hashable, float] | None
+            Mapping from each index element to its value, or None if not
+            solved yet.
+
+        Examples
+        --------
+        >>> vals = ship.values_as_dict()
+        >>> vals[('W1', 'C1')]
+        50.0
+        """
+        return _values_as_dict(self._set_index, self.value)
 
     def __repr__(self) -> str:
         return f"Variable(index={self._set_index.name!r}, shape={self.shape})"
@@ -576,8 +879,9 @@ class Parameter(cp.Parameter):
     ----------
     index : Set
         The index set for this parameter.
-    data : dict[Hashable, float], optional
-        Initial values as a dict mapping index elements to values.
+    data : dict[Hashable, float] or np.ndarray, optional
+        Initial values, either as a dict mapping index elements to values or
+        as an array in index order (see :meth:`set_data`).
     name : str, optional
         Name for the parameter.
     **kwargs
@@ -587,6 +891,7 @@ class Parameter(cp.Parameter):
     --------
     >>> routes = Set([('W1', 'C1'), ('W1', 'C2')], name='routes')
     >>> cost = Parameter(routes, data={('W1', 'C1'): 10, ('W1', 'C2'): 20})
+    >>> cost = Parameter(routes, data=np.array([10, 20]))  # same, in index order
     >>>
     >>> # All CVXPY operations work!
     >>> cost @ ship                  # inner product
@@ -597,7 +902,7 @@ class Parameter(cp.Parameter):
     def __init__(
         self,
         index: Set,
-        data: dict[Hashable, float] | None = None,
+        data: dict[Hashable, float] | np.ndarray | None = None,
         name: str | None = None,
         **kwargs,
     ):
@@ -611,18 +916,52 @@ class Parameter(cp.Parameter):
         """The Set indexing this parameter."""
         return self._set_index
 
-    def set_data(self, data: dict[Hashable, float]) -> None:
-        """Set parameter values from a dict.
+    def set_data(self, data: Mapping[Hashable, float] | pd.Series | np.ndarray) -> None:
+        """Set parameter values from a dict or an array.
 
         Parameters
         ----------
-        data : dict[Hashable, float]
-            A dict mapping index elements to values.
+        data : Mapping[Hashable, float], pd.Series or np.ndarray
+            A dict or Series mapping index elements to values (missing
+            elements are 0), or an array of values in index order. On a
+            cross product an array may also have one axis per factor, so a
+            ``(len(A), len(B))`` array lines up with ``Set.cross(A, B)``.
+
+        Raises
+        ------
+        ValueError
+            If an array is neither 1-D with one value per index element nor,
+            on a cross product, shaped exactly like its factors.
+
+        Examples
+        --------
+        >>> routes = Set.cross(warehouses, customers)  # 2 x 3
+        >>> cost.set_data(np.array([[10, 15, 20], [12, 18, 25]]))
         """
+        if isinstance(data, np.ndarray):
+            # Only accept shapes that pin down the layout: a transposed matrix
+            # has the right size but would load silently misaligned
+            shapes: list[tuple[int, ...]] = [(len(self._set_index),)]
+            if isinstance(self._set_index, CrossSet):
+                factor_shape = tuple(len(src) for src in self._set_index._sources)
+                if factor_shape not in shapes:
+                    shapes.append(factor_shape)
+            if data.shape not in shapes:
+                expected = " or ".join(map(str, shapes))
+                raise ValueError(
+                    f"Data array has shape {data.shape}, "
+                    f"expected {expected} for index '{self._set_index.name}'"
+                )
+            self.value = np.asarray(data, dtype=float).ravel()
+            return
+
+        # Resolve all keys to positions, then fill with one scatter. Pairs come
+        # from items() so any mapping works, pd.Series included (iterating a
+        # Series yields its values, not its labels).
+        items = list(data.items())
+        positions = self._set_index.positions([key for key, _ in items])
         values = np.zeros(len(self._set_index))
-        for elem, val in data.items():
-            pos = self._set_index.position(elem)
-            values[pos] = val
+        values[positions] = np.fromiter((v for _, v in items), dtype=float, count=len(items))
         self.value = values
 
     def __getitem__(self, key):
@@ -631,8 +970,10 @@ class Parameter(cp.Parameter):
         If key is in the Set, returns the element at that position.
         Otherwise, delegates to standard CVXPY indexing (slices, etc.).
         """
-        if key in self._set_index:
-            return super().__getitem__(self._set_index.position(key))
+        if not isinstance(key, (slice, list, np.ndarray)):
+            pos = self._set_index._find(key)
+            if pos is not None:
+                return super().__getitem__(pos)
         return super().__getitem__(key)
 
     def get_value(self, key: Hashable) -> float | None:
@@ -648,9 +989,21 @@ class Parameter(cp.Parameter):
         float | None
             The value at that index, or None if not set yet.
         """
-        if self.value is None:
+        value = self.value
+        if value is None:
             return None
-        return float(self.value[self._set_index.position(key)])
+        return float(value[self._set_index.position(key)])
+
+    def values_as_dict(self) -> dict[Hashable, float] | None:
+        """Get all values as a dict keyed by index element.
+
+        Returns
+        -------
+        dict[Hashable, float] | None
+            Mapping from each index element to its value, or None if no
+            data is set.
+        """
+        return _values_as_dict(self._set_index, self.value)
 
     def expand(self, target_index: Set, positions: list[int] | list[str]) -> Parameter:
         """Expand (broadcast) this parameter to a larger cross-product index.
@@ -686,36 +1039,116 @@ class Parameter(cp.Parameter):
         >>> shipments = Set.cross(warehouses, customers, periods)
         >>> cost_3d = cost.expand(shipments, [0, 1])
         """
+        src_positions = self._expand_positions(target_index, positions)
+
+        if self.value is None:
+            result_values = np.zeros(len(target_index))
+        else:
+            result_values = np.asarray(self.value)[src_positions]
+
+        result = Parameter(target_index)
+        result.value = result_values
+        return result
+
+    def expand_sparse(self, target_index: Set, positions: list[int] | list[str]) -> cp.Expression:
+        """Expand this parameter to a larger index as a sparse matrix product.
+
+        Like `expand`, but returns ``E @ self`` instead of a new Parameter
+        holding copied values. The sparse selector ``E`` has a single 1 per
+        row, picking the matching element of this parameter, so the result
+        follows later `set_data` calls and keeps the problem DPP.
+
+        The result is indexed by `target_index` but contains this parameter,
+        so use it in products and constraints rather than in ``sum_by`` or
+        ``where``, which infer the index from the expression.
+
+        Parameters
+        ----------
+        target_index : Set
+            The target cross-product index to expand to.
+        positions : list[int] | list[str]
+            Which positions in the target index correspond to this parameter's
+            index.
+
+        Returns
+        -------
+        cp.Expression
+            An expression of shape ``(len(target_index),)``.
+
+        Examples
+        --------
+        >>> shipments = Set.cross(warehouses, customers, periods)
+        >>> cost_3d = cost.expand_sparse(shipments, ['warehouses', 'customers'])
+        >>> m.minimize(cost_3d @ ship)
+        """
+        return self._expansion_matrix(target_index, positions) @ self
+
+    def _expand_positions(self, target_index: Set, positions: list[int] | list[str]) -> np.ndarray:
+        """Return, for each element of `target_index`, the matching position in self."""
         if not target_index._is_compound:
             raise ValueError("Target index must be a compound (cross-product) index")
 
         # Normalize positions to integers
         pos_indices = [target_index._resolve_position(p) for p in positions]
 
-        # Build lookup: for each element in target_index, find the key in self
-        result_values = np.zeros(len(target_index))
-
-        for i, elem in enumerate(target_index):
-            # Extract the key for this parameter from the target element
-            elem_tuple = cast(tuple, elem)  # Safe: target_index._is_compound is True
-            if len(pos_indices) == 1:
-                key: Hashable = elem_tuple[pos_indices[0]]
-            else:
-                key = tuple(elem_tuple[p] for p in pos_indices)
-
-            # Look up value from this parameter
-            src_pos = self._set_index.position(key)
-            if self.value is not None:
-                result_values[i] = self.value[src_pos]
+        # Group target elements by their key in self, look up each distinct key
+        # once, then map the positions back onto every element
+        rows, _ = _group_rows(target_index, pos_indices)
+        first = np.unique(rows, return_index=True)[1]
+        keys = target_index._keys_at(first, pos_indices)
+        return self._set_index.positions(keys)[rows]
+
+    def _expansion_matrix(
+        self, target_index: Set, positions: list[int] | list[str]
+    ) -> sp.csr_matrix:
+        """Build the selector E with ``E @ self.value == self.expand(...).value``."""
+        n_target = len(target_index)
+        if isinstance(target_index, CrossSet) and target_index._is_compound:
+            # If self is indexed by exactly the kept factors, in order, E is a
+            # Kronecker product: identities for kept factors, columns of ones
+            # for the others. Out-of-range positions fall through so they
+            # raise exactly as in expand().
+            sources = target_index._sources
+            pos_indices = [target_index._resolve_position(p) for p in positions]
+            in_range = all(-len(sources) <= p < len(sources) for p in pos_indices)
+            pos_indices = [p % len(sources) for p in pos_indices]
+            kept = [sources[p] for p in pos_indices]
+            own = self._set_index
+            if (
+                in_range
+                and pos_indices == sorted(set(pos_indices))
+                and (
+                    (len(kept) == 1 and own == kept[0])
+                    or (isinstance(own, CrossSet) and own._sources == tuple(kept))
+                )
+            ):
+                factors = [
+                    sp.eye(len(src), format="csr")
+                    if k in pos_indices
+                    else sp.csr_matrix(np.ones((len(src), 1)))
+                    for k, src in enumerate(sources)
+                ]
+                return sp.csr_matrix(
+                    reduce(lambda left, right: sp.kron(left, right, format="csr"), factors)
+                )
 
-        result = Parameter(target_index)
-        result.value = result_values
-        return result
+        src_positions = self._expand_positions(target_index, positions)
+        return sp.csr_matrix(
+            (np.ones(n_target), src_positions, np.arange(n_target + 1)),
+            shape=(n_target, len(self._set_index)),
+        )
 
     def __repr__(self) -> str:
         return f"Parameter(index={self._set_index.name!r}, shape={self.shape})"
 
 
+def _values_as_dict(index: Set, value: Any) -> dict[Hashable, float] | None:
+    """Pair index elements with values (converted to floats in one call)."""
+    if value is None:
+        return None
+    return dict(zip(index._elements, np.asarray(value, dtype=np.float64).ravel().tolist()))
+
+
 def _infer_index(expr: cp.Expression) -> Set:
     """Infer the Set index from Variables/Parameters in an expression tree.
 
@@ -738,17 +1171,23 @@ def _infer_index(expr: cp.Expression) -> Set:
     TypeError
         If expression contains no indexed objects or objects from different indices.
     """
-    indices: set[Set] = set()
+    found: dict[int, Set] = {}
 
     def walk(node):
         if isinstance(node, (Variable, Parameter)):
-            indices.add(node._set_index)
+            found[id(node._set_index)] = node._set_index
         if hasattr(node, "args"):
             for arg in node.args:
                 walk(arg)
 
     walk(expr)
 
+    # Usually every leaf shares one Set object; only compare (and hash) Sets
+    # when there are several, since hashing a CrossSet builds its elements
+    indices = list(found.values())
+    if len(indices) > 1:
+        indices = list(set(indices))
+
     if len(indices) == 0:
         raise TypeError("Cannot infer index: expression contains no Variable or Parameter.")
     if len(indices) > 1:
@@ -760,7 +1199,65 @@ def _infer_index(expr: cp.Expression) -> Set:
     return indices.pop()
 
 
-def _build_aggregation_matrix(index: Set, pos_indices: list[int]) -> sp.csr_matrix:
+def _factorize_column(col: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Number the distinct values of a position column by first occurrence.
+
+    Returns (codes, levels) with ``levels[codes] == col``. pd.factorize
+    coerces missing values (None becomes NaN) and, without its NA sentinel,
+    merges None with NaN; here missing values are numbered per type instead,
+    and their levels are the original objects.
+    """
+    col = _native_column(col)
+    codes, uniques = pd.factorize(col)
+    missing = np.flatnonzero(codes < 0)
+    if not len(missing):
+        return codes, np.asarray(uniques)
+    na_codes: dict[type, int] = {}
+    for i in missing.tolist():
+        codes[i] = len(uniques) + na_codes.setdefault(type(col[i]), len(na_codes))
+    # Renumber so that codes follow first occurrence again
+    codes = pd.factorize(codes)[0]
+    first = np.unique(codes, return_index=True)[1]
+    return codes, col[first]
+
+
+def _native_column(col: np.ndarray) -> np.ndarray:
+    """Convert an object column of plain integers to int64.
+
+    pandas factorizes int64 columns with a native hashtable, several times
+    faster than hashing Python objects. Other columns are returned unchanged.
+    """
+    if pd.api.types.infer_dtype(col, skipna=False) == "integer":
+        try:
+            return col.astype(np.int64)
+        except OverflowError:
+            pass
+    return col
+
+
+def _group_rows(index: Set, pos_indices: list[int]) -> tuple[np.ndarray, int]:
+    """Assign each element of a compound index the id of its group.
+
+    Groups are the distinct values at `pos_indices`, numbered in order of
+    first occurrence. Works on the Set's cached integer codes, so no tuple
+    keys are built or hashed per element.
+
+    Returns
+    -------
+    tuple
+        (rows, n_groups) where rows[j] is the group id of element j.
+    """
+    codes = index._position_codes()
+    rows = codes[:, pos_indices[0]]
+    for p in pos_indices[1:]:
+        # Combine with the next position and renumber, keeping ids below len(index)
+        col = codes[:, p]
+        rows = pd.factorize(rows * (int(col.max()) + 1) + col)[0]
+    n_groups = int(rows.max()) + 1 if len(rows) else 0
+    return rows, n_groups
+
+
+def _build_aggregation_matrix(index: Set, pos_indices: list[int]) -> sp.csc_matrix:
     """Build a sparse aggregation matrix for sum_by.
 
     Parameters
@@ -772,43 +1269,33 @@ def _build_aggregation_matrix(index: Set, pos_indices: list[int]) -> sp.csr_matr
 
     Returns
     -------
-    sp.csr_matrix
+    sp.csc_matrix
         Aggregation matrix of shape (n_groups, len(index)).
     """
+    if isinstance(index, CrossSet) and all(
+        -len(index._sources) <= p < len(index._sources) for p in pos_indices
+    ):
+        # Row-major cross product: the matrix is a Kronecker product of an
+        # identity for each kept factor and a row of ones for each summed one.
+        # Groups follow first occurrence, i.e. the kept factors in position
+        # order, whatever the order of pos_indices.
+        kept = {p % len(index._sources) for p in pos_indices}
+        factors = [
+            sp.eye(len(src), format="csc") if k in kept else sp.csc_matrix(np.ones((1, len(src))))
+            for k, src in enumerate(index._sources)
+        ]
+        return sp.csc_matrix(
+            reduce(lambda left, right: sp.kron(left, right, format="csc"), factors)
+        )
 
-    # Function to extract group key from element
-    def get_key(elem: tuple[Any, ...]) -> Hashable:
-        if len(pos_indices) == 1:
-            return elem[pos_indices[0]]
-        return tuple(elem[i] for i in pos_indices)
-
-    # Find unique keys (preserving order of first occurrence)
-    group_keys: list[Hashable] = []
-    seen: set[Hashable] = set()
-    for elem in index:
-        key = get_key(cast(tuple[Any, ...], elem))
-        if key not in seen:
-            group_keys.append(key)
-            seen.add(key)
-
-    # Build sparse matrix
-    n_groups = len(group_keys)
-    n_elements = len(index)
-
-    key_to_row = {k: i for i, k in enumerate(group_keys)}
-
-    rows: list[int] = []
-    cols: list[int] = []
-    data: list[float] = []
-
-    for j, elem in enumerate(index):
-        key = get_key(cast(tuple[Any, ...], elem))
-        row = key_to_row[key]
-        rows.append(row)
-        cols.append(j)
-        data.append(1.0)
+    rows, n_groups = _group_rows(index, pos_indices)
 
-    return sp.csr_matrix((data, (rows, cols)), shape=(n_groups, n_elements))
+    # Every column has a single 1 in its group's row, so the CSC arrays can be
+    # written down directly (no COO triplets to sort and convert)
+    n_elements = len(index)
+    indptr = np.arange(n_elements + 1)
+    data = np.ones(n_elements)
+    return sp.csc_matrix((data, rows, indptr), shape=(n_groups, n_elements))
 
 
 def _build_where_mask(
@@ -830,14 +1317,17 @@ def _build_where_mask(
     Returns
     -------
     np.ndarray
-        Float array of 1.0 (included) and 0.0 (excluded).
+        Float array of 1.0 (included) and 0.0 (excluded). Masks built from
+        keyword filters are cached on the index and returned read-only.
     """
     if cond is not None and kwargs:
         raise ValueError("Cannot specify both cond and keyword arguments")
 
     if cond is not None:
         if callable(cond):
-            mask = np.array([cond(elem) for elem in index], dtype=float)
+            # Collect the predicate's results straight into a bool array
+            keep = np.fromiter(map(cond, index), dtype=bool, count=len(index))
+            mask = keep.astype(float)
         else:
             mask = np.asarray(cond, dtype=float)
             if mask.shape != (len(index),):
@@ -851,18 +1341,31 @@ def _build_where_mask(
                 f"Set '{index.name}' contains simple elements."
             )
 
-        n = len(index)
-        mask = np.ones(n, dtype=float)
+        filters: dict[int, frozenset] = {}
         for key, allowed in kwargs.items():
             pos = index._resolve_position(key)
             if not isinstance(allowed, (list, tuple, set)):
-                allowed = {allowed}
-            else:
-                allowed = set(allowed)
-            for i, elem in enumerate(index):
-                elem_tuple = cast(tuple[Any, ...], elem)
-                if elem_tuple[pos] not in allowed:
-                    mask[i] = 0.0
+                allowed = [allowed]
+            filters[pos] = frozenset(allowed)
+
+        # Keyword filters are plain values, so the mask can be reused whenever
+        # the same filters are applied to this Set again
+        cache_key = frozenset(filters.items())
+        cached = index._mask_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        codes = index._position_codes()
+        levels = cast(list[np.ndarray], index._levels)
+        keep = np.ones(len(index), dtype=bool)
+        for pos, allowed in filters.items():
+            # Test each distinct value once, then map the result onto the rows
+            level = levels[pos]
+            level_keep = np.fromiter((v in allowed for v in level), dtype=bool, count=len(level))
+            keep &= level_keep[codes[:, pos]]
+        mask = keep.astype(float)
+        mask.flags.writeable = False
+        index._mask_cache[cache_key] = mask
     else:
         raise ValueError("Must specify either cond or keyword arguments")
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from collections.abc import Hashable
 from difflib import get_close_matches
+from itertools import islice
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -55,24 +56,29 @@ def validate_keys(
         Position 0 ('warehouses'): 'TYPO' is not valid.
         Did you mean: 'W1' or 'W2'?
     """
-    index_elements = set(index._elements)
-    data_keys = set(data.keys())
+    # Compare against the Set's position dict directly; key views support
+    # set comparisons without copying either side into a new set.
+    index_keys = index._pos.keys()
+
+    # Fast path: exactly the index elements
+    if data.keys() == index_keys:
+        return
 
     # Check for extra keys (keys in data but not in index)
-    extra_keys = data_keys - index_elements
+    extra_keys = data.keys() - index_keys
     if extra_keys:
-        key = next(iter(extra_keys))  # Report first invalid key
+        key = next(k for k in data if k in extra_keys)  # Report first invalid key
         msg = _format_invalid_key_error(key, index, context)
         raise ValidationError(msg)
 
-    # Check for missing keys (unless partial data is allowed)
+    # Count missing keys from the key difference itself: a size difference
+    # would be off whenever the Set repeats elements
     if not allow_partial:
-        missing_keys = index_elements - data_keys
+        missing_keys = index_keys - data.keys()
         if missing_keys:
-            n_missing = len(missing_keys)
-            examples = list(missing_keys)[:3]
+            examples = list(islice((e for e in index._elements if e in missing_keys), 3))
             msg = (
-                f"Missing {n_missing} key(s) in {context}.\n"
+                f"Missing {len(missing_keys)} key(s) in {context}.\n"
                 f"    Index '{index.name}' has {len(index)} elements, "
                 f"but only {len(data)} provided.\n"
                 f"    Missing examples: {examples}"
@@ -230,7 +236,7 @@ def validate_parameter(
     context = f"Parameter '{param.name}'"
 
     # Convert numpy array to dict for validation
-    data = {elem: param.value[i] for i, elem in enumerate(param.index._elements)}
+    data = cast(dict[Hashable, Any], param.values_as_dict())
 
     if numeric:
         validate_numeric(data, context=context)
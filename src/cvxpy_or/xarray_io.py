@@ -6,6 +6,7 @@ xarray DataArrays and exporting Variable values back to DataArrays.
 
 from __future__ import annotations
 
+from functools import cache
 from itertools import product
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,8 +18,13 @@ if TYPE_CHECKING:
     from cvxpy_or.sets import Parameter, Set, Variable
 
 
+@cache
 def _check_xarray():
-    """Check that xarray is available."""
+    """Check that xarray is available.
+
+    The module is looked up once and cached; a failed import is not cached,
+    so the error is raised again on every call.
+    """
     try:
         import xarray  # noqa: F401
 
@@ -131,9 +137,7 @@ def parameter_from_dataarray(
     values = da.values.flatten(order="C")
 
     param_name = name or (str(da.name) if da.name is not None else None)
-    param = ParameterClass(index, name=param_name)
-    param.value = values
-    return param
+    return ParameterClass(index, data=values, name=param_name)
 
 
 def variable_like_dataarray(
@@ -268,18 +272,12 @@ def _indexed_to_dataarray(
             "Use Set(..., names=('dim1', 'dim2')) when creating the Set."
         )
 
-    # Extract unique values per dimension (preserving order)
-    dim_coords: dict[str, list[Any]] = {}
-    for i, dim_name in enumerate(index._names):
-        seen: set[Any] = set()
-        dim_values: list[Any] = []
-        for elem in index._elements:
-            elem_tuple = cast(tuple[Any, ...], elem)
-            val = elem_tuple[i]
-            if val not in seen:
-                dim_values.append(val)
-                seen.add(val)
-        dim_coords[dim_name] = dim_values
+    # Unique values per dimension, in order of first occurrence
+    index._position_codes()
+    levels = cast(list[np.ndarray], index._levels)
+    dim_coords: dict[str, list[Any]] = {
+        dim_name: levels[i].tolist() for i, dim_name in enumerate(index._names)
+    }
 
     # Compute shape
     shape = tuple(len(dim_coords[dim]) for dim in index._names)
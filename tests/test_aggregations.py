@@ -117,6 +117,29 @@ class TestGroupKeys(unittest.TestCase):
         keys = group_keys(routes, ["w", "c"])
         self.assertEqual(keys, [("W1", "C1"), ("W1", "C2"), ("W2", "C1"), ("W2", "C2")])
 
+    def test_group_keys_missing_values(self):
+        """Test None and NaN keys stay separate groups with their own objects."""
+        idx = Set([(None, "a"), (np.nan, "a"), ("x", "b"), (None, "b")], names=("k", "v"))
+        var = Variable(idx)
+        var.value = np.array([1.0, 2.0, 3.0, 4.0])
+
+        keys = group_keys(idx, "k")
+
+        self.assertIsNone(keys[0])
+        self.assertTrue(np.isnan(keys[1]))
+        self.assertEqual(keys[2], "x")
+        np.testing.assert_array_equal(sum_by(var, "k").value, [5.0, 2.0, 3.0])
+
+    def test_cross_product_index_stays_lazy(self):
+        """Test aggregating over a cross product does not build its elements."""
+        routes = Set.cross(Set(["W1", "W2"], name="w"), Set(["C1", "C2"], name="c"))
+        var = Variable(routes)
+
+        mean_by(var + 1, "w")
+        count_by(routes, "c")
+
+        self.assertNotIn("_elements", routes.__dict__)
+
 
 class TestMaxBy(unittest.TestCase):
     """Tests for max_by function."""
@@ -0,0 +1,50 @@
+"""Tests for cvxpy_or.constraints module."""
+
+import unittest
+
+import cvxpy as cp
+import numpy as np
+
+from cvxpy_or import Set, Variable, flow_balance
+
+
+class TestFlowBalance(unittest.TestCase):
+    """Tests for flow_balance."""
+
+    def test_shortest_path(self):
+        """Test a unit of flow takes the cheapest path through the network."""
+        nodes = Set(["A", "B", "C"], name="nodes")
+        arcs = Set([("A", "B"), ("B", "C"), ("A", "C")], name="arcs", names=("src", "dst"))
+        flow = Variable(arcs, nonneg=True)
+        cost = np.array([1.0, 1.0, 3.0])
+
+        constraints = flow_balance(flow, "src", "dst", node_supply={"A": 1.0, "C": -1.0})
+        self.assertEqual(len(constraints), len(nodes))
+        prob = cp.Problem(cp.Minimize(cost @ flow), constraints)
+        prob.solve()
+
+        self.assertEqual(prob.status, "optimal")
+        np.testing.assert_allclose(flow.value, [1.0, 1.0, 0.0], atol=1e-6)
+
+    def test_tuple_node_labels(self):
+        """Test nodes labelled by tuples, such as grid cells, are matched whole."""
+        start, mid, end = (0, 0), (0, 1), (1, 1)
+        supply = {start: 1.0, end: -1.0}
+        cases = [
+            ([(start, mid), (mid, end), (start, end)], [3.0, 2.0, 1.0], [0.0, 0.0, 1.0]),
+            ([(start, mid), (mid, end)], [1.0, 1.0], [1.0, 1.0]),
+        ]
+        for arc_list, cost, expected in cases:
+            arcs = Set(arc_list, name="arcs")
+            flow = Variable(arcs, nonneg=True)
+            constraints = flow_balance(flow, 0, 1, node_supply=supply)
+            self.assertEqual(len(constraints), 3)
+            prob = cp.Problem(cp.Minimize(np.array(cost) @ flow), constraints)
+            prob.solve()
+
+            self.assertEqual(prob.status, "optimal")
+            np.testing.assert_allclose(flow.value, expected, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 
 import cvxpy as cp
+import numpy as np
 
 from cvxpy_or import Model, Set, sum_by
 
@@ -118,6 +119,90 @@ class TestModel(unittest.TestCase):
         total_shipped = sum(ship.value)
         self.assertGreaterEqual(total_shipped, 150 - 0.1)
 
+    def test_resolve_reuses_problem(self):
+        """Test that re-solving after a parameter update reuses the problem."""
+        m = Model()
+        idx = Set(["a", "b"], name="items")
+        x = m.add_variable(idx, name="x", nonneg=True)
+        cost = m.add_parameter(idx, data={"a": 1, "b": 2}, name="cost")
+        m.add_constraint("total", cp.sum(x) >= 1)
+        m.minimize(cost @ x)
+
+        m.solve()
+        problem = m._problem
+        self.assertAlmostEqual(m.value, 1.0, places=4)
+
+        cost.set_data({"a": 3, "b": 2})
+        m.solve()
+        self.assertIs(m._problem, problem)
+        self.assertAlmostEqual(m.value, 2.0, places=4)
+
+    def test_resolve_rebuilds_after_change(self):
+        """Test that adding a constraint invalidates the cached problem."""
+        m = Model()
+        idx = Set(["a", "b"], name="items")
+        x = m.add_variable(idx, name="x", nonneg=True)
+        m.minimize(cp.sum(x))
+
+        m.solve()
+        problem = m._problem
+
+        m.add_constraint("lower", x >= 1)
+        m.solve()
+        self.assertIsNot(m._problem, problem)
+        self.assertAlmostEqual(m.value, 2.0, places=4)
+
+    def test_default_solver(self):
+        """Test that default_solver is used unless solve() names a solver."""
+        m = Model(default_solver=cp.HIGHS)
+        idx = Set(["a", "b"], name="items")
+        x = m.add_variable(idx, name="x", nonneg=True)
+        m.add_constraint("upper", x <= 5)
+        m.maximize(cp.sum(x))
+
+        m.solve()
+        self.assertEqual(m._problem.solver_stats.solver_name, cp.HIGHS)
+
+        m.solve(solver=cp.CLARABEL)
+        self.assertEqual(m._problem.solver_stats.solver_name, cp.CLARABEL)
+
+    def test_sum_multiply_objective_becomes_matmul(self):
+        """Test that sum(multiply(param, var)) objectives are rewritten as param @ var."""
+        m = Model()
+        idx = Set(["a", "b"], name="items")
+        x = m.add_variable(idx, name="x", nonneg=True)
+        cost = m.add_parameter(idx, data={"a": 1, "b": 2}, name="cost")
+        m.add_constraint("total", cp.sum(x) >= 1)
+
+        m.minimize(cp.sum(cp.multiply(x, cost)) + cp.sum(x))
+        self.assertEqual(type(m.objective.args[0]).__name__, "MulExpression")
+
+        m.solve()
+        self.assertAlmostEqual(m.value, 2.0, places=4)
+
+    def test_solve_batch(self):
+        """Test solving parameter scenarios in worker processes."""
+        m = Model(default_solver=cp.HIGHS)
+        idx = Set(["a", "b"], name="items")
+        cost = m.add_parameter(idx, data={"a": 1.0, "b": 2.0}, name="cost")
+        x = m.add_variable(idx, nonneg=True, name="x")
+        m.add_constraint("total", cp.sum(x) >= 1)
+        m.minimize(cost @ x)
+
+        results = m.solve_batch(
+            [{"cost": np.array([3.0, 2.0])}, {"cost": {"a": 0.5, "b": 4.0}}],
+            max_workers=2,
+        )
+
+        self.assertEqual([r["status"] for r in results], [cp.OPTIMAL, cp.OPTIMAL])
+        self.assertAlmostEqual(results[0]["value"], 2.0, places=4)
+        self.assertAlmostEqual(results[1]["value"], 0.5, places=4)
+        np.testing.assert_allclose(results[0]["variables"]["x"], [0.0, 1.0], atol=1e-6)
+        np.testing.assert_allclose(results[1]["variables"]["x"], [1.0, 0.0], atol=1e-6)
+        # The model itself is not solved or modified
+        self.assertIsNone(m.status)
+        np.testing.assert_allclose(cost.value, [1.0, 2.0])
+
     def test_summary(self):
         """Test model summary."""
         m = Model(name="test_model")
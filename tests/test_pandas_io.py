@@ -28,6 +28,13 @@ from cvxpy_or.pandas_io import (
 class TestSetFromDataFrame(unittest.TestCase):
     """Tests for set_from_dataframe."""
 
+    def test_dedup_keeps_first_appearance_and_shares_labels(self):
+        """Test duplicate rows are dropped in order and equal labels share one object."""
+        df = pd.DataFrame({"w": ["W2", "W1", "W2", "W1"], "t": [1, 1, 1, 2]})
+        result = set_from_dataframe(df, ["w", "t"])
+        self.assertEqual(list(result), [("W2", 1), ("W1", 1), ("W1", 2)])
+        self.assertIs(result._elements[1][0], result._elements[2][0])
+
     def test_2d_set(self):
         """Test creating 2D Set from DataFrame."""
         df = pd.DataFrame(
@@ -118,6 +125,13 @@ class TestParameterFromDataFrame(unittest.TestCase):
         self.assertEqual(cost.get_value(("W1", "C1")), 10)
         self.assertEqual(cost.get_value(("W2", "C2")), 25)
 
+    def test_1d_parameter(self):
+        """Test creating 1D Parameter from a single index column."""
+        df = pd.DataFrame({"warehouse": ["W1", "W2", "W3"], "supply": [100, 150, 200]})
+        supply = parameter_from_dataframe(df, "warehouse", "supply")
+        self.assertEqual(list(supply.index), ["W1", "W2", "W3"])
+        self.assertEqual(supply.get_value("W2"), 150)
+
     def test_3d_parameter(self):
         """Test creating 3D Parameter from DataFrame."""
         df = pd.DataFrame(
@@ -189,6 +203,18 @@ class TestParameterFromDataFrame(unittest.TestCase):
         self.assertIs(cost.index, shipments)
         self.assertEqual(cost.get_value(("W1", "C1", "T1")), 10)
 
+    def test_partial_data_and_unknown_key(self):
+        """Test that missing rows default to 0 and unknown keys raise KeyError."""
+        routes = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2"]))
+        df = pd.DataFrame({"w": ["W2", "W1"], "c": ["C1", "C2"], "cost": [5.0, 7.0]})
+
+        cost = parameter_from_dataframe(df, ["w", "c"], "cost", index=routes)
+        np.testing.assert_array_equal(cost.value, [0.0, 7.0, 5.0, 0.0])
+
+        df.loc[2] = ["W3", "C1", 1.0]
+        with self.assertRaises(KeyError):
+            parameter_from_dataframe(df, ["w", "c"], "cost", index=routes)
+
 
 class TestVariableToDataFrame(unittest.TestCase):
     """Tests for variable_to_dataframe."""
@@ -248,6 +274,20 @@ class TestParameterToDataFrame(unittest.TestCase):
         row = df[(df["warehouse"] == "W1") & (df["customer"] == "C1") & (df["period"] == "T1")]
         self.assertEqual(row["value"].iloc[0], 10)
 
+    def test_value_col_clashes_with_index_column(self):
+        """Test a value column named like an index column raises, not overwrites."""
+        routes = Set.cross(
+            Set(["W1", "W2"], name="value"), Set(["C1"], name="customer"), name="routes"
+        )
+        param = Parameter(routes, data=np.array([1.0, 2.0]), name="cost")
+        with self.assertRaises(ValueError) as ctx:
+            parameter_to_dataframe(param)
+        self.assertIn("value_col", str(ctx.exception))
+
+        df = parameter_to_dataframe(param, value_col="cost")
+        self.assertListEqual(list(df.columns), ["value", "customer", "cost"])
+        self.assertListEqual(df["value"].tolist(), ["W1", "W2"])
+
 
 class TestRoundTrip(unittest.TestCase):
     """Tests for round-trip DataFrame conversions."""
@@ -413,6 +453,12 @@ class TestSetFromSeries(unittest.TestCase):
         result = set_from_series(s)
         self.assertEqual(result.name, "letters")
 
+    def test_categorical_keeps_appearance_order(self):
+        """Test that categorical Series give used values in order of appearance."""
+        s = pd.Series(["C", "A", "C"], dtype=pd.CategoricalDtype(["A", "B", "C"]))
+        result = set_from_series(s)
+        self.assertEqual(list(result), ["C", "A"])
+
 
 class TestSetFromIndex(unittest.TestCase):
     """Tests for set_from_index."""
@@ -465,6 +511,29 @@ class TestParameterFromSeries(unittest.TestCase):
         self.assertEqual(param.get_value("W1"), 100)
         self.assertEqual(param.get_value("W2"), 150)
 
+    def test_series_with_existing_index(self):
+        """Test that Series values are placed by label, not by order."""
+        warehouses = Set(["W1", "W2", "W3"], name="warehouses")
+        s = pd.Series({"W3": 30, "W1": 10})
+        param = parameter_from_series(s, index=warehouses)
+        np.testing.assert_array_equal(param.value, [10.0, 0.0, 30.0])
+
+    def test_duplicate_labels(self):
+        """Test repeated labels behave like a dict: first position, last value."""
+        s = pd.Series([1.0, 2.0, 3.0], index=["W2", "W1", "W2"], name="supply")
+        param = parameter_from_series(s)
+        self.assertEqual(param.index.to_list(), ["W2", "W1"])
+        np.testing.assert_array_equal(param.value, [3.0, 2.0])
+
+        idx = pd.MultiIndex.from_tuples([("W1", "C1"), ("W1", "C2"), ("W1", "C1")])
+        param = parameter_from_series(pd.Series([1.0, 2.0, 3.0], index=idx))
+        self.assertEqual(param.index.to_list(), [("W1", "C1"), ("W1", "C2")])
+        np.testing.assert_array_equal(param.value, [3.0, 2.0])
+
+        warehouses = Set(["W1", "W2", "W3"])
+        param = parameter_from_series(s, index=warehouses)
+        np.testing.assert_array_equal(param.value, [2.0, 3.0, 0.0])
+
     def test_multiindex_series(self):
         """Test creating Parameter from MultiIndex Series."""
         idx = pd.MultiIndex.from_tuples(
@@ -41,6 +41,36 @@ class TestSet(unittest.TestCase):
         self.assertIn("C", str(ctx.exception))
         self.assertIn("test", str(ctx.exception))
 
+    def test_positions_bulk_lookup(self):
+        """Test looking up many positions at once."""
+        idx = Set(["X", "Y", "Z"], name="test")
+        np.testing.assert_array_equal(idx.positions(["Z", "X", "Z"]), [2, 0, 2])
+        routes = Set([("W1", "C1"), ("W1", "C2"), ("W2", "C1")])
+        np.testing.assert_array_equal(routes.positions([("W2", "C1"), ("W1", "C2")]), [2, 1])
+        with self.assertRaises(KeyError) as ctx:
+            idx.positions(["X", "W"])
+        self.assertIn("W", str(ctx.exception))
+        self.assertIn("test", str(ctx.exception))
+
+    def test_positions_from_numpy_array(self):
+        """Test a native-dtype array is looked up in one vectorized call."""
+        idx = Set([30, 10, 20], name="nums")
+        np.testing.assert_array_equal(idx.positions(np.array([20, 30, 20])), [2, 0, 2])
+        with self.assertRaises(KeyError) as ctx:
+            idx.positions(np.array([10, 40]))
+        self.assertIn("40", str(ctx.exception))
+        self.assertIsNotNone(idx._index)
+
+    def test_positions_from_pandas_index(self):
+        """Test pandas Index input is matched against the Set's own Index."""
+        import pandas as pd
+
+        routes = Set([("W1", "C1"), ("W1", "C2"), ("W2", "C1")], name="routes")
+        keys = pd.MultiIndex.from_tuples([("W2", "C1"), ("W1", "C1")])
+        np.testing.assert_array_equal(routes.positions(keys), [2, 0])
+        with self.assertRaises(KeyError):
+            routes.positions(pd.MultiIndex.from_tuples([("W3", "C1")]))
+
     def test_compound_index(self):
         """Test index with tuple elements."""
         idx = Set([("W1", "C1"), ("W1", "C2"), ("W2", "C1")], name="routes")
@@ -62,6 +92,8 @@ class TestSet(unittest.TestCase):
         with self.assertRaises(KeyError) as ctx:
             idx._resolve_position("invalid")
         self.assertIn("invalid", str(ctx.exception))
+        with self.assertRaises(KeyError):
+            idx._resolve_position(["first"])
 
     def test_names_arity_mismatch(self):
         """Test error when names don't match tuple arity."""
@@ -100,6 +132,83 @@ class TestParameter(unittest.TestCase):
         param.set_data({"X": 10.0, "Y": 20.0})
         np.testing.assert_array_equal(param.value, [10.0, 20.0])
 
+    def test_set_data_partial(self):
+        """Test that elements missing from the dict are set to zero."""
+        idx = Set(["X", "Y", "Z"])
+        param = Parameter(idx, data={"Z": 3.0, "X": 1.0})
+        np.testing.assert_array_equal(param.value, [1.0, 0.0, 3.0])
+
+    def test_set_data_unknown_key(self):
+        """Test error when the dict has a key outside the index."""
+        idx = Set(["X", "Y"], name="xy")
+        param = Parameter(idx)
+        with self.assertRaises(KeyError) as ctx:
+            param.set_data({"X": 1.0, "Q": 2.0})
+        self.assertIn("Q", str(ctx.exception))
+        self.assertIn("xy", str(ctx.exception))
+
+    def test_set_data_from_array(self):
+        """Test setting data from an array in index order."""
+        idx = Set(["X", "Y", "Z"])
+        param = Parameter(idx, data=np.array([1, 2, 3]))
+        np.testing.assert_array_equal(param.value, [1.0, 2.0, 3.0])
+
+    def test_set_data_from_2d_array(self):
+        """Test that a 2D array lines up with a cross-product index."""
+        rows = Set(["W1", "W2"], name="rows")
+        cols = Set(["C1", "C2", "C3"], name="cols")
+        idx = Set.cross(rows, cols)
+        param = Parameter(idx, data=np.array([[1, 2, 3], [4, 5, 6]]))
+        self.assertEqual(param.get_value(("W1", "C3")), 3.0)
+        self.assertEqual(param.get_value(("W2", "C1")), 4.0)
+
+    def test_set_data_cross_product_dict(self):
+        """Test dict data on a cross product, including keys it does not contain."""
+        routes = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2", "C3"]), name="routes")
+        param = Parameter(routes, data={("W2", "C1"): 4.0, ("W1", "C3"): 3.0})
+        np.testing.assert_array_equal(param.value, [0, 0, 3, 4, 0, 0])
+        for bad_key in [("W3", "C1"), ("W1",), "W1"]:
+            with self.assertRaises(KeyError) as ctx:
+                param.set_data({("W1", "C1"): 1.0, bad_key: 2.0})
+            self.assertIn(repr(bad_key), str(ctx.exception))
+            self.assertIn("routes", str(ctx.exception))
+
+    def test_set_data_from_series(self):
+        """Test a pandas Series is read by label, not by iterating its values."""
+        import pandas as pd
+
+        param = Parameter(Set(["a", "b", "c"]))
+        param.set_data(pd.Series({"c": 3.0, "a": 1.0}))
+        np.testing.assert_array_equal(param.value, [1.0, 0.0, 3.0])
+
+        routes = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2"]))
+        cost = Parameter(routes)
+        cost.set_data(pd.Series({("W2", "C1"): 4.0, ("W1", "C2"): 2.0}))
+        np.testing.assert_array_equal(cost.value, [0.0, 2.0, 4.0, 0.0])
+
+    def test_set_data_array_wrong_size(self):
+        """Test error when array size does not match the index."""
+        idx = Set(["X", "Y"], name="xy")
+        param = Parameter(idx)
+        with self.assertRaises(ValueError) as ctx:
+            param.set_data(np.array([1.0, 2.0, 3.0]))
+        self.assertIn("xy", str(ctx.exception))
+
+    def test_set_data_transposed_array(self):
+        """Test an array with the right size but the wrong shape is rejected."""
+        routes = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2", "C3"]), name="routes")
+        param = Parameter(routes)
+        for bad in [np.ones((3, 2)), np.ones((6, 1)), np.ones((1, 6))]:
+            with self.assertRaises(ValueError) as ctx:
+                param.set_data(bad)
+            self.assertIn("(2, 3)", str(ctx.exception))
+            self.assertIn("routes", str(ctx.exception))
+        self.assertIsNone(param.value)
+
+        flat = Parameter(Set(["a", "b"]))
+        with self.assertRaises(ValueError):
+            flat.set_data(np.ones((2, 1)))
+
     def test_is_cvxpy_parameter(self):
         """Test that Parameter IS a cp.Parameter."""
         idx = Set(["A"])
@@ -131,6 +240,14 @@ class TestParameter(unittest.TestCase):
         param = Parameter(idx)
         self.assertIsNone(param.get_value("A"))
 
+    def test_get_value_unknown_key(self):
+        """Test get_value raises KeyError for elements outside the index."""
+        idx = Set(["A", "B"], name="letters")
+        param = Parameter(idx, data={"A": 1.0, "B": 2.0})
+        with self.assertRaises(KeyError) as ctx:
+            param.get_value("Z")
+        self.assertIn("letters", str(ctx.exception))
+
 
 class TestVariable(unittest.TestCase):
     """Tests for the Variable class."""
@@ -153,6 +270,16 @@ class TestVariable(unittest.TestCase):
         var = Variable(idx, nonneg=True)
         self.assertTrue(var.is_nonneg())
 
+    def test_values_as_dict(self):
+        """Test exporting all values as an element-keyed dict."""
+        idx = Set([("W1", "C1"), ("W1", "C2")])
+        var = Variable(idx)
+        self.assertIsNone(var.values_as_dict())
+        var.value = np.array([1.5, 2.0])
+        vals = var.values_as_dict()
+        self.assertEqual(vals, {("W1", "C1"): 1.5, ("W1", "C2"): 2.0})
+        self.assertIs(type(vals[("W1", "C1")]), float)
+
     def test_getitem(self):
         """Test element access by key."""
         idx = Set([("W1", "C1"), ("W1", "C2")])
@@ -161,6 +288,19 @@ class TestVariable(unittest.TestCase):
         # Should return an indexed expression
         self.assertEqual(elem.shape, ())
 
+    def test_getitem_falls_back_to_cvxpy_indexing(self):
+        """Test slices, arrays and lists index positionally; cross keys resolve lazily."""
+        idx = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2"]))
+        var = Variable(idx)
+        var.value = np.array([1.0, 2.0, 3.0, 4.0])
+
+        self.assertEqual(var[("W2", "C1")].value, 3.0)
+        self.assertEqual(var[1:3].shape, (2,))
+        np.testing.assert_array_equal(var[np.array([3, 0])].value, [4.0, 1.0])
+        np.testing.assert_array_equal(var[[0, 2]].value, [1.0, 3.0])
+        self.assertEqual(var[-1].value, 4.0)
+        self.assertNotIn("_pos", idx.__dict__)
+
     def test_cvxpy_sum(self):
         """Test cp.sum() works on Variable."""
         idx = Set(["A", "B", "C"])
@@ -417,6 +557,82 @@ class TestEfficiency(unittest.TestCase):
         # Should be sparse @ var, which is a MulExpression
         self.assertEqual(type(result).__name__, "MulExpression")
 
+    def test_aggregation_matrix_groups_by_first_occurrence(self):
+        """Verify the aggregation matrix puts one 1 per column in its group's row."""
+        from cvxpy_or.sets import _build_aggregation_matrix
+
+        idx = Set([("A", 1), ("A", 2), ("B", 1), ("B", 2), ("C", 2)])
+
+        agg = _build_aggregation_matrix(idx, [1])
+
+        np.testing.assert_array_equal(
+            agg.toarray(),
+            [[1, 0, 1, 0, 0], [0, 1, 0, 1, 1]],
+        )
+
+    def test_aggregation_matrix_multiple_positions(self):
+        """Verify grouping on several positions reuses the Set's cached codes."""
+        from cvxpy_or.sets import _build_aggregation_matrix
+
+        idx = Set([("B", 1, "x"), ("A", 1, "y"), ("B", 2, "x"), ("A", 1, "x"), ("B", 1, "y")])
+
+        agg = _build_aggregation_matrix(idx, [2, 0])
+        codes = idx._codes
+
+        np.testing.assert_array_equal(
+            agg.toarray(),
+            [[1, 0, 1, 0, 0], [0, 1, 0, 0, 0], [0, 0, 0, 1, 0], [0, 0, 0, 0, 1]],
+        )
+        _build_aggregation_matrix(idx, [1])
+        self.assertIs(idx._codes, codes)
+
+    def test_position_column(self):
+        """Verify _column returns one position's values for every element."""
+        idx = Set([("A", 1), ("B", 2), ("A", 3)])
+
+        self.assertEqual(idx._column(0).tolist(), ["A", "B", "A"])
+        self.assertEqual(idx._column(1).tolist(), [1, 2, 3])
+        self.assertEqual(idx._levels[0].tolist(), ["A", "B"])
+
+    def test_integer_positions_encoded_natively(self):
+        """Verify integer positions are factorized as int64, others as objects."""
+        idx = Set([("A", 2), ("B", 1), ("A", 1), ("C", 2**70)])
+
+        np.testing.assert_array_equal(idx._position_codes(), [[0, 0], [1, 1], [0, 1], [2, 2]])
+        self.assertEqual(idx._levels[0].dtype, object)
+        self.assertEqual(idx._levels[1].dtype, object)
+
+        idx = Set([(3, 2), (1, 2), (3, 5)])
+        idx._position_codes()
+        self.assertEqual(idx._levels[1].dtype, np.int64)
+        self.assertEqual(idx._levels[1].tolist(), [2, 5])
+
+    def test_cross_aggregation_matrix_matches_grouping(self):
+        """Verify the Kronecker-built matrix of a cross product equals the generic one."""
+        from cvxpy_or.sets import _build_aggregation_matrix
+
+        idx = Set.cross(Set(["A", "B"]), Set([1, 2, 3]), Set(["x", "y"]))
+        plain = Set(list(idx))
+
+        for pos in ([0], [1], [0, 2], [2, 0], [-1]):
+            np.testing.assert_array_equal(
+                _build_aggregation_matrix(idx, pos).toarray(),
+                _build_aggregation_matrix(plain, pos).toarray(),
+            )
+        self.assertIsNone(idx._codes)
+
+    def test_sum_by_reuses_cached_aggregation_matrix(self):
+        """Verify repeated sum_by calls on one Set build the matrix only once."""
+        idx = Set([("A", 1), ("A", 2), ("B", 1)], names=("letter", "number"))
+        var = Variable(idx)
+
+        sum_by(var, "letter")
+        agg = idx._agg_cache[(0,)]
+        sum_by(var, 0)
+
+        self.assertIs(idx._agg_cache[(0,)], agg)
+        np.testing.assert_array_equal(agg.toarray(), [[1, 1, 0], [0, 0, 1]])
+
 
 class TestSetCross(unittest.TestCase):
     """Tests for Set.cross() cross-product functionality."""
@@ -464,6 +680,67 @@ class TestSetCross(unittest.TestCase):
         self.assertIn(("A", 1, "x"), idx)
         self.assertIn(("B", 2, "y"), idx)
 
+    def test_cross_is_cached(self):
+        """Test that repeated cross products reuse the same Set."""
+        a = Set(["A", "B"], name="a")
+        b = Set([1, 2], name="b")
+
+        first = Set.cross(a, b, name="ab")
+
+        self.assertIs(Set.cross(a, b, name="ab"), first)
+        self.assertIsNot(Set.cross(a, b, name="other"), first)
+        self.assertIsNot(Set.cross(a, b, names=("x", "y")), first)
+
+    def test_cross_cache_respects_factor_names(self):
+        """Test that equal factors with different names give different position names."""
+        a = Set(["A", "B"], name="a")
+        b1 = Set([1, 2], name="b1")
+        b2 = Set([1, 2], name="b2")
+
+        self.assertEqual(Set.cross(a, b1).names, ("a", "b1"))
+        self.assertEqual(Set.cross(a, b2).names, ("a", "b2"))
+
+    def test_cross_cache_holds_products_weakly(self):
+        """Test the cache neither keeps products alive nor hashes lazy factors."""
+        import gc
+        import weakref
+
+        a = Set(["A", "B"], name="a")
+        bc = Set.cross(Set([1, 2], name="b"), Set(["x", "y"], name="c"))
+
+        abc = Set.cross(a, bc, name="abc")
+        self.assertIs(Set.cross(a, bc, name="abc"), abc)
+        self.assertNotIn("_elements", vars(bc))
+
+        ref = weakref.ref(abc)
+        del abc
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(a._cross_cache), 0)
+
+    def test_cross_positions_without_elements(self):
+        """Test positions, membership and grouping of a cross product are lazy."""
+        a = Set(["A", "B"], name="a")
+        b = Set([1, 2, 3], name="b")
+        c = Set(["x", "y"], name="c")
+        idx = Set.cross(a, b, c)
+        var = Variable(idx)
+
+        self.assertEqual(idx.position(("B", 2, "x")), 8)
+        np.testing.assert_array_equal(idx.positions([("A", 1, "y"), ("B", 3, "y")]), [1, 11])
+        self.assertNotIn(("C", 1, "x"), idx)
+        self.assertNotIn("A", idx)
+        with self.assertRaises(KeyError):
+            idx.position(("A", 4, "x"))
+        sum_by(var, ["a", "c"])
+        where(var, b=2)
+        self.assertNotIn("_elements", idx.__dict__)
+
+        plain = Set(list(idx), names=idx.names)
+        np.testing.assert_array_equal(idx._position_codes(), plain._position_codes())
+        self.assertEqual(idx, plain)
+        self.assertEqual([idx.position(e) for e in plain], list(range(len(plain))))
+
     def test_cross_requires_two_indices(self):
         """Test that cross requires at least 2 indices."""
         a = Set(["A", "B"])
@@ -536,6 +813,72 @@ class TestParameterExpand(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(expanded.value, [0.1, 0.1, 0.2, 0.2])
 
+    def test_expand_reordered_positions(self):
+        """Test expand when the key positions are not in the parameter's order."""
+        customers = Set(["C1", "C2"], name="customers")
+        warehouses = Set(["W1", "W2", "W3"], name="warehouses")
+        cost = Parameter(
+            Set.cross(customers, warehouses),
+            data=np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]),
+        )
+        routes = Set.cross(warehouses, customers)
+
+        expanded = cost.expand(routes, [1, 0])
+
+        np.testing.assert_array_almost_equal(expanded.value, [1, 4, 2, 5, 3, 6])
+
+    def test_expand_target_with_none_key(self):
+        """Test expand looks up None keys as None, not NaN."""
+        kinds = Set([None, "x"], name="kinds")
+        cost = Parameter(kinds, data={None: 1.0, "x": 2.0})
+        target = Set([(None, 1), ("x", 1), (None, 2)])
+
+        np.testing.assert_array_equal(cost.expand(target, [0]).value, [1.0, 2.0, 1.0])
+
+    def test_expand_missing_key_raises(self):
+        """Test expand raises KeyError when a target key is not in the index."""
+        warehouses = Set(["W1"], name="warehouses")
+        holding_cost = Parameter(warehouses, data={"W1": 0.1})
+        inv_idx = Set.cross(Set(["W1", "W2"]), Set(["T1"]))
+
+        with self.assertRaises(KeyError):
+            holding_cost.expand(inv_idx, [0])
+
+    def test_expand_sparse_matches_expand(self):
+        """Test expand_sparse gives expand's values and follows later set_data."""
+        warehouses = Set(["W1", "W2"], name="warehouses")
+        customers = Set(["C1", "C2", "C3"], name="customers")
+        periods = Set(["T1", "T2"], name="periods")
+        shipments = Set.cross(warehouses, customers, periods)
+        cost = Parameter(Set.cross(warehouses, customers), data=np.arange(6.0))
+        holding = Parameter(periods, data={"T1": 1.0, "T2": 2.0})
+        swapped = Parameter(Set.cross(customers, warehouses), data=np.arange(6.0))
+
+        cases = [(cost, [0, 1]), (holding, ["periods"]), (swapped, [1, 0])]
+        for param, positions in cases:
+            np.testing.assert_array_equal(
+                param.expand_sparse(shipments, positions).value,
+                param.expand(shipments, positions).value,
+            )
+
+        expr = holding.expand_sparse(shipments, ["periods"])
+        holding.set_data({"T1": 5.0, "T2": 7.0})
+        np.testing.assert_array_equal(expr.value, [5.0, 7.0] * 6)
+        ship = Variable(shipments, nonneg=True)
+        self.assertTrue(cp.Problem(cp.Minimize(expr @ ship)).is_dpp())
+
+    def test_expand_sparse_out_of_range_position(self):
+        """Test expand_sparse rejects an out-of-range position like expand."""
+        periods = Set(["T1", "T2"], name="periods")
+        target = Set.cross(Set(["W1", "W2"]), Set(["C1", "C2"]), periods)
+        holding = Parameter(periods, data={"T1": 1.0, "T2": 2.0})
+
+        with self.assertRaises(IndexError) as expected:
+            holding.expand(target, [5])
+        with self.assertRaises(IndexError) as actual:
+            holding.expand_sparse(target, [5])
+        self.assertEqual(str(actual.exception), str(expected.exception))
+
     def test_expand_inner_product(self):
         """Test that expanded parameter can be used in @ operator."""
         warehouses = Set(["W1", "W2"], name="warehouses")
@@ -738,6 +1081,55 @@ class TestWhere(unittest.TestCase):
         expr = where(var, origin=["W1", "W2"])
         self.assertIsInstance(expr, cp.Expression)
 
+    def test_where_callable_mask_values(self):
+        """Test a callable's results become a 0/1 float mask."""
+        from cvxpy_or.sets import _build_where_mask
+
+        idx = Set([("W1", 1), ("W2", 5), ("W3", 2)])
+
+        mask = _build_where_mask(lambda r: r[1] > 1, idx, {})
+
+        self.assertEqual(mask.dtype, np.float64)
+        np.testing.assert_array_equal(mask, [0.0, 1.0, 1.0])
+
+    def test_where_kwargs_mask_values(self):
+        """Test keyword filters on several positions combine into one mask."""
+        from cvxpy_or.sets import _build_where_mask
+
+        routes = Set(
+            [("W1", "C1", 1), ("W1", "C2", 2), ("W2", "C1", 1), ("W3", "C2", 1)],
+            names=("origin", "dest", "period"),
+        )
+
+        mask = _build_where_mask(None, routes, {"origin": ["W1", "W3"], "period": 1})
+
+        np.testing.assert_array_equal(mask, [1.0, 0.0, 0.0, 1.0])
+
+    def test_where_kwargs_missing_values(self):
+        """Test None and NaN keys are kept apart and matched as themselves."""
+        from cvxpy_or.sets import _build_where_mask
+
+        idx = Set([(None, 1), (None, 2), (np.nan, 1), ("x", 2)], names=("a", "b"))
+
+        np.testing.assert_array_equal(_build_where_mask(None, idx, {"a": None}), [1, 1, 0, 0])
+        np.testing.assert_array_equal(_build_where_mask(None, idx, {"a": np.nan}), [0, 0, 1, 0])
+        np.testing.assert_array_equal(
+            _build_where_mask(None, idx, {"a": [None, "x"], "b": 2}), [0, 1, 0, 1]
+        )
+        self.assertIsNone(idx._levels[0][0])
+
+    def test_where_kwargs_mask_is_cached(self):
+        """Test the same keyword filters reuse one read-only mask."""
+        from cvxpy_or.sets import _build_where_mask
+
+        routes = Set([("W1", "C1"), ("W2", "C2"), ("W3", "C1")], names=("origin", "dest"))
+
+        mask = _build_where_mask(None, routes, {"origin": ["W1", "W3"]})
+
+        self.assertIs(_build_where_mask(None, routes, {"origin": ("W3", "W1")}), mask)
+        self.assertIsNot(_build_where_mask(None, routes, {"origin": "W1"}), mask)
+        self.assertFalse(mask.flags.writeable)
+
     def test_where_simple_index_rejects_kwargs(self):
         """Test error when using kwargs on simple index."""
         idx = Set(["A", "B", "C"], name="simple")
@@ -772,6 +1164,42 @@ class TestWhere(unittest.TestCase):
         # Objective should be 2 (A + C only)
         self.assertAlmostEqual(prob.value, 2.0, places=4)
 
+    def test_where_trivial_masks(self):
+        """Test all-ones masks return the expression and all-zeros masks keep the leaf."""
+        idx = Set([("W1", "C1"), ("W2", "C1")], names=("origin", "dest"))
+        var = Variable(idx)
+        var.value = np.array([1.0, 2.0])
+
+        self.assertIs(where(var, dest="C1"), var)
+        zero = where(var, dest="C2")
+        self.assertEqual(zero.variables(), [var])
+        np.testing.assert_array_equal(zero.value, [0.0, 0.0])
+        self.assertNotIsInstance(where(var, np.array([2.0, 1.0])), Variable)
+
+    def test_where_matching_nothing_composes_with_sum_by(self):
+        """Test a filter that matches nothing can still be aggregated."""
+        routes = Set.cross(Set(["W1", "W2"], name="w"), Set(["C1", "C2", "C3"], name="c"))
+        ship = Variable(routes)
+        ship.value = np.arange(1.0, 7.0)
+
+        totals = sum_by(where(ship, w="ZZ"), "c")
+
+        self.assertEqual(totals.shape, (3,))
+        np.testing.assert_array_equal(totals.value, [0.0, 0.0, 0.0])
+
+    def test_where_sparse_mask_solves_correctly(self):
+        """Test a mostly-zero mask gives the same result via the sparse selector."""
+        idx = Set(["A", "B", "C", "D", "E"], name="items")
+        var = Variable(idx, nonneg=True)
+
+        filtered = where(var, lambda item: item == "B")
+        prob = cp.Problem(cp.Maximize(cp.sum(filtered)), [var <= [1, 2, 3, 4, 5]])
+        prob.solve()
+
+        self.assertEqual(filtered.shape, (5,))
+        self.assertAlmostEqual(prob.value, 2.0, places=4)
+        np.testing.assert_allclose(filtered.value, [0, 2, 0, 0, 0], atol=1e-6)
+
     def test_where_expression_solves_correctly(self):
         """Test where() on expression produces correct results.
 
@@ -32,6 +32,24 @@ class TestValidateKeys(unittest.TestCase):
         self.assertIn("Missing", str(ctx.exception))
         self.assertIn("1 key(s)", str(ctx.exception))
 
+    def test_missing_keys_examples_in_index_order(self):
+        """Test that missing-key examples follow the index order."""
+        idx = Set(["a", "b", "c", "d", "e"], name="letters")
+        data = {"c": 1, "a": 2}
+        with self.assertRaises(ValidationError) as ctx:
+            validate_keys(data, idx)
+        self.assertIn("3 key(s)", str(ctx.exception))
+        self.assertIn("['b', 'd', 'e']", str(ctx.exception))
+
+    def test_missing_count_with_repeated_elements(self):
+        """Test the missing count comes from the keys, not the sizes."""
+        idx = Set(["a", "b", "a", "c"], name="letters")
+        validate_keys({"a": 1, "b": 2, "c": 3}, idx)
+        with self.assertRaises(ValidationError) as ctx:
+            validate_keys({"a": 1}, idx)
+        self.assertIn("Missing 2 key(s)", str(ctx.exception))
+        self.assertIn("['b', 'c']", str(ctx.exception))
+
     def test_allow_partial(self):
         """Test partial data is allowed with flag."""
         idx = Set(["a", "b", "c"], name="letters")